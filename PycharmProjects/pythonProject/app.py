@@ -1,39 +1,115 @@
-from flask import Flask, render_template, request
-from datetime import datetime
-import random
+from flask import Flask, Response, abort, jsonify, render_template, request
+from datetime import date
+
+from markupsafe import escape
+
+from catalog import get_catalog, normalize_language
+from core import COLOR_MODES, TOTAL_WEEKS, calculate_weeks_lived
+from dates import MAX_DATE_LENGTH, parse_date, parse_dates
+from grid_render import iter_svg, render_png
+from reminders import ReminderSampler
+from result_cache import ResultCache, next_week_boundary
 
 app = Flask(__name__)
 
-# 配置激励短语（英文和中文）
-reminders_en = [
-    "Life is short, don’t let procrastination be your default mode.",
-    "Every week is precious, don't waste time procrastinating!",
-    "Every decision you make today shapes the future you.",
-    "You can choose to procrastinate or act now and make a change.",
-    "What you do today determines your freedom tomorrow.",
-    "The future belongs to those who act today. Don’t let procrastination stand in your way.",
-    "Procrastination just makes time fly by faster.",
-    "How many weeks do you have left to waste? Stop procrastinating now!",
-    "Time waits for no one; seize today to secure your future.",
-]
-
-reminders_cn = [
-    "人生短暂，不要让拖延成为你的常态。",
-    "每一周都是宝贵的，不要浪费时间拖延！",
-    "现在的每一个决定，决定了未来的你。",
-    "你可以选择拖延，也可以选择现在行动，做出改变。",
-    "今天做的事，决定你明天的自由。",
-    "未来属于那些今天行动的人，别让拖延阻挡你。",
-    "拖延只能让时间流逝得更快。",
-    "你看看还有多少周可以浪费？不要再拖延了！",
-]
-
-
-# 计算已经度过的周数
-def calculate_weeks_lived(birth_date):
-    current_date = datetime.now()
-    delta = current_date - birth_date
-    return delta.days // 7
+
+# 批量接口：单次请求最多处理的日期数
+BATCH_MAX_SIZE = 100000
+
+
+# 批量计算已经度过和剩余的周数，无效日期对应位置为 None
+def calculate_weeks_batch(birth_date_strs, today=None):
+    import numpy as np
+
+    count = len(birth_date_strs)
+    births = _to_datetime64(np, birth_date_strs)
+    if births is None:
+        # 有格式不对或不存在的日期（例如 2 月 30 日）时才逐个解析，找出无效项
+        dates, errors = parse_dates(birth_date_strs)
+        valid = np.ones(count, dtype=bool)
+        valid[list(errors)] = False
+        births = np.array([d for d in dates if d is not None], dtype="datetime64[D]")
+    else:
+        errors = {}
+        valid = np.ones(count, dtype=bool)
+
+    today = np.datetime64(today or date.today(), "D")
+    weeks_lived = (today - births).astype(np.int64) // 7
+
+    lived = np.full(count, None, dtype=object)
+    remaining = np.full(count, None, dtype=object)
+    lived[valid] = weeks_lived
+    remaining[valid] = TOTAL_WEEKS - weeks_lived
+    return {
+        "count": count,
+        "weeks_lived": lived.tolist(),
+        "weeks_remaining": remaining.tolist(),
+        "errors": {str(index): message for index, message in errors.items()},
+    }
+
+
+def _to_datetime64(np, birth_date_strs):
+    """全部是标准 YYYY-MM-DD 时整批转成 datetime64[D]，否则返回 None。"""
+    # 请求体里可能有数字、嵌套列表等任意 JSON，只有全是字符串时才交给 numpy
+    if not all(isinstance(text, str) for text in birth_date_strs):
+        return None
+    texts = np.array(birth_date_strs)
+    if texts.dtype != np.dtype("<U10") or not texts.size:
+        return None
+    # 每个字符是一个 UCS-4 码位，一次比较检查所有位置：第 5、8 位是 "-"，其余是 ASCII 数字
+    codes = texts.view(np.uint32).reshape(-1, 10)
+    dashes = codes[:, [4, 7]]
+    digits = codes[:, [0, 1, 2, 3, 5, 6, 8, 9]]
+    if not ((dashes == ord("-")).all() and ((digits >= ord("0")) & (digits <= ord("9"))).all()):
+        return None
+    try:
+        births = texts.astype("datetime64[D]")
+    except ValueError:
+        return None
+    # numpy 接受公元 0 年，strptime 不接受
+    if not (births >= np.datetime64("0001-01-01")).all():
+        return None
+    return births
+
+
+# 批量接口，请求体为 {"birth_dates": ["YYYY-MM-DD", ...]}，结果按列返回
+@app.route("/api/weeks", methods=["POST"])
+def weeks_batch():
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify(error="request body must be a JSON object"), 400
+    birth_date_strs = payload.get("birth_dates")
+    if not isinstance(birth_date_strs, list):
+        return jsonify(error="birth_dates must be a list"), 400
+    if len(birth_date_strs) > BATCH_MAX_SIZE:
+        return jsonify(error=f"at most {BATCH_MAX_SIZE} birth dates per request"), 413
+    return jsonify(calculate_weeks_batch(birth_date_strs))
+
+
+# 首页结果缓存：键为 (出生日期, 语言)，值为预先渲染好的结果页面，在下一个整周到来时过期
+result_cache = ResultCache(max_entries=4096)
+# 预渲染页面中激励短语的占位符，每次请求再替换成随机选出的短语
+REMINDER_PLACEHOLDER = "__LIFE_WEEKS_REMINDER__"
+# 各线程共用，每种语言的短语一轮抽完才会重复
+reminder_sampler = ReminderSampler()
+
+
+def _render_result(birth_date_str, language):
+    birth_date = parse_date(birth_date_str)
+    weeks_lived = calculate_weeks_lived(birth_date)
+    weeks_remaining = TOTAL_WEEKS - weeks_lived
+
+    result_text = get_catalog(language)["result_text"].format(weeks_lived=weeks_lived,
+                                                              weeks_remaining=weeks_remaining)
+
+    page = render_template("result.html", result_text=result_text, reminder=REMINDER_PLACEHOLDER)
+    return page, next_week_boundary(birth_date, weeks_lived)
+
+
+def _invalid_date_page(language):
+    # 错误提示只有明确选择中文时才用中文
+    error = get_catalog(language, default="en")["invalid_date"]
+    return render_template("index.html", error=error)
 
 
 # 首页路由，显示表单和结果
@@ -42,28 +118,66 @@ def home():
     if request.method == "POST":
         birth_date_str = request.form.get("birth_date")
         language = request.form.get("language")
+        # 超长的输入不可能是有效日期，不拿来当缓存键
+        if birth_date_str is None or len(birth_date_str) > MAX_DATE_LENGTH:
+            return _invalid_date_page(language)
+
+        # 语言的不同写法（en、English、未选择时的默认语言）渲染出同样的页面，共用一个缓存项
+        code = normalize_language(language)
+        key = (birth_date_str, code)
+        page = result_cache.get(key)
+        if page is None:
+            try:
+                page, expires_at = _render_result(birth_date_str, code)
+            except ValueError:
+                return _invalid_date_page(language)
+            result_cache.put(key, page, expires_at)
 
-        try:
-            birth_date = datetime.strptime(birth_date_str, "%Y-%m-%d")
-            weeks_lived = calculate_weeks_lived(birth_date)
-            total_weeks = 88 * 52
-            weeks_remaining = total_weeks - weeks_lived
+        # 选择激励短语
+        reminder = reminder_sampler.draw(code)
+        return page.replace(REMINDER_PLACEHOLDER, str(escape(reminder)))
 
-            # 选择激励短语
-            if language == "English":
-                reminder = random.choice(reminders_en)
-                result_text = f"You have lived {weeks_lived} weeks, approximately {weeks_remaining} weeks remaining."
-            else:
-                reminder = random.choice(reminders_cn)
-                result_text = f"你已经度过了 {weeks_lived} 周，剩余大约 {weeks_remaining} 周。"
+    return render_template("index.html")
 
-            return render_template("result.html", result_text=result_text, reminder=reminder)
 
-        except ValueError:
-            error = "请输入有效的出生日期 (格式: YYYY-MM-DD)" if language == "中文" else "Please enter a valid birth date (format: YYYY-MM-DD)"
-            return render_template("index.html", error=error)
+# 首页结果缓存的命中情况
+@app.route("/api/cache/stats")
+def cache_stats():
+    return jsonify(result_cache.stats())
 
-    return render_template("index.html")
+
+# 格子图片的默认尺寸和上限
+GRID_DEFAULT_SIZE = (900, 600)
+GRID_MAX_SIZE = 4000
+
+
+def _grid_request_args():
+    try:
+        birth_date = parse_date(request.args.get("birth_date", ""))
+        width = int(request.args.get("width", GRID_DEFAULT_SIZE[0]))
+        height = int(request.args.get("height", GRID_DEFAULT_SIZE[1]))
+    except ValueError:
+        abort(400)
+    color_mode = request.args.get("mode", "solid")
+    if not (0 < width <= GRID_MAX_SIZE and 0 < height <= GRID_MAX_SIZE) or color_mode not in COLOR_MODES:
+        abort(400)
+    return calculate_weeks_lived(birth_date), TOTAL_WEEKS, width, height, color_mode
+
+
+# 生命格子图，SVG 流式输出
+@app.route("/grid.svg")
+def grid_svg():
+    weeks_lived, total_weeks, width, height, color_mode = _grid_request_args()
+    return Response(iter_svg(weeks_lived, total_weeks, width, height, color_mode=color_mode),
+                    mimetype="image/svg+xml")
+
+
+# 生命格子图，PNG 格式
+@app.route("/grid.png")
+def grid_png():
+    weeks_lived, total_weeks, width, height, color_mode = _grid_request_args()
+    return Response(render_png(weeks_lived, total_weeks, width, height, color_mode=color_mode),
+                    mimetype="image/png")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+"""首页的 ASCII 横幅。
+
+横幅文字只在导入时整理一次；BannerCache 按字号测量每个横幅的像素尺寸（每个字号只测一次），
+并记住每种画布尺寸下能完整放下横幅的最大字号，首页重新开始动画时不需要再测量：
+
+    banners = BannerCache(canvas)
+    size = banners.fit_size(index, canvas_width, canvas_height)
+    canvas.create_text(x, y, text=BANNERS[index], font=banners.font(size))
+
+BannerImages 把横幅按 (横幅, 字号) 预先渲染成图片，首页只需放一个图片图元，不用每次排版几百个字形。
+渲染需要 Pillow 和一个等宽 TrueType 字体；缺少任何一个时 get 返回 None，调用方退回文字图元。
+"""
+import tkinter.font as tkfont
+from collections import OrderedDict
+from functools import lru_cache
+
+BANNER_FONT_FAMILY = "Courier"
+# 候选字号，从大到小依次尝试
+BANNER_FONT_SIZES = tuple(range(20, 3, -1))
+BANNER_MARGIN = 20
+FIT_CACHE_SIZE = 256
+BANNER_IMAGE_CACHE_SIZE = 32
+# 依次尝试的等宽字体文件，Pillow 会在系统字体目录中查找
+BANNER_FONT_FILES = ("cour.ttf", "Courier New.ttf", "DejaVuSansMono.ttf", "LiberationMono-Regular.ttf",
+                     "Menlo.ttc")
+
+_BANNER_ART = [
+    r"""
+  ____  ____  __  ____  ____    ____  _  _  ____    ____   __   _  _  _   
+ / ___)(  __)(  )(  __)(  __)  (_  _)/ )( \(  __)  (    \/ _\ ( \/ )( \  
+ \___ \ ) _)  )(  ) _)  ) _)     )(  ) __ ( ) _)    ) D (/    \ )  / \_/  
+ (____/(____)(__)(____)(____)   (__) \_)(_/(____)  (____/\_/\_/(__/  (_)  
+    """,
+    r"""
+   ____    _           __  __         ___            __
+  / __/__ (_)__ ___   / /_/ /  ___   / _ \___ ___ __/ /
+ _\ \/ -_) /_ // -_) / __/ _ \/ -_) / // / _ `/ // /_/ 
+/___/\__/_//__ /\__/  \__/_//_/\__/ /____/\_,_/\_, (_)  
+                                             /___/     
+    """,
+    r"""
+  ██████ ▓█████  ██▓▒███████▒▓█████    ▄▄▄█████▓ ██░ ██ ▓█████    ▓█████▄  ▄▄▄     ▓██   ██▓    ▐██▌ 
+▒██    ▒ ▓█   ▀ ▓██▒▒ ▒ ▒ ▄▀░▓█   ▀    ▓  ██▒ ▓▒▓██░ ██▒▓█   ▀    ▒██▀ ██▌▒████▄    ▒██  ██▒    ▐██▌ 
+░ ▓██▄   ▒███   ▒██▒░ ▒ ▄▀▒░ ▒███      ▒ ▓██░ ▒░▒██▀▀██░▒███      ░██   █▌▒██  ▀█▄   ▒██ ██░    ▐██▌ 
+  ▒   ██▒▒▓█  ▄ ░██░  ▄▀▒   ░▒▓█  ▄    ░ ▓██▓ ░ ░▓█ ░██ ▒▓█  ▄    ░▓█▄   ▌░██▄▄▄▄██  ░ ▐██▓░    ▓██▒ 
+▒██████▒▒░▒████▒░██░▒███████▒░▒████▒     ▒██▒ ░ ░▓█▒░██▓░▒████▒   ░▒████▓  ▓█   ▓██▒ ░ ██▒▓░    ▒▄▄  
+▒ ▒▓▒ ▒ ░░░ ▒░ ░░▓  ░▒▒ ▓░▒░▒░░ ▒░ ░     ▒ ░░    ▒ ░░▒░▒░░ ▒░ ░    ▒▒▓  ▒  ▒▒   ▓▒█░  ██▒▒▒     ░▀▀▒ 
+░ ░▒  ░ ░ ░ ░  ░ ▒ ░░░▒ ▒ ░ ▒ ░ ░  ░       ░     ▒ ░▒░ ░ ░ ░  ░    ░ ▒  ▒   ▒   ▒▒ ░▓██ ░▒░     ░  ░ 
+░  ░  ░     ░    ▒ ░░ ░ ░ ░ ░   ░        ░       ░  ░░ ░   ░       ░ ░  ░   ░   ▒   ▒ ▒ ░░         ░ 
+      ░     ░  ░ ░    ░ ░       ░  ░             ░  ░  ░   ░  ░      ░          ░  ░░ ░         ░    
+                    ░                                              ░                ░ ░             
+    """,
+    r"""
+ ____                                   __    __                  ____                       __     
+/\  _`\           __                   /\ \__/\ \                /\  _`\                    /\ \    
+\ \ \L\_\     __ /\_\  ____      __    \ \ ,_\ \ \___      __    \ \ \L\ \     __     __  __\ \ \   
+ \/_\__ \   /'__`\/\ \/\_,`\  /'__`\   \ \ \/\ \  _ `\  /'__`\   \ \ ,__/   /'__`\  /\ \/\ \\ \ \  
+   /\ \L\ \/\  __/\ \ \/_/  /_/\  __/    \ \ \_\ \ \ \ \/\  __/    \ \ \/\  /\ \L\._\ \ \_\ \\ \_\ 
+   \ `\____\ \____\\ \_/\____\ \____\    \ \__\\ \_\ \_\ \____\    \ \_\ \_\ \__/\_.\/`____ \ \_/_
+    \/_____/\/____/ \/_/\/____/\/____/     \/__/ \/_/\/_/\/____/     \/___/  \/_/\/_/ `/___/> \/_/ 
+                                                                                      /\___/    
+                                                                                      \/__/     
+    """,
+    r"""
+███████╗███████╗██╗███████╗███████╗    ████████╗██╗  ██╗███████╗    ██████╗  █████╗ ██╗   ██╗██╗
+██╔════╝██╔════╝██║╚══███╔╝██╔════╝    ╚══██╔══╝██║  ██║██╔════╝    ██╔══██╗██╔══██╗╚██╗ ██╔╝██║
+███████╗█████╗  ██║  ███╔╝ █████╗         ██║   ███████║█████╗      ██║  ██║███████║ ╚████╔╝ ██║
+╚════██║██╔══╝  ██║ ███╔╝  ██╔══╝         ██║   ██╔══██║██╔══╝      ██║  ██║██╔══██║  ╚██╔╝  ╚═╝
+███████║███████╗██║███████╗███████╗       ██║   ██║  ██║███████╗    ██████╔╝██║  ██║   ██║   ██╗
+╚══════╝╚══════╝╚═╝╚══════╝╚══════╝       ╚═╝   ╚═╝  ╚═╝╚══════╝    ╚═════╝ ╚═╝  ╚═╝   ╚═╝   ╚═╝
+    """
+]
+
+
+def _trim(art):
+    lines = [line.rstrip() for line in art.splitlines()]
+    while lines and not lines[0]:
+        lines.pop(0)
+    while lines and not lines[-1]:
+        lines.pop()
+    return "\n".join(lines)
+
+
+BANNERS = tuple(_trim(art) for art in _BANNER_ART)
+
+
+def _image_size(font, lines):
+    # 与 BannerImages._render 创建的图片大小一致：最宽一行的宽度加 1 像素，行高为上下伸部之和
+    ascent, descent = font.getmetrics()
+    return max(1, max(int(font.getlength(line)) + 1 for line in lines)), (ascent + descent) * len(lines)
+
+
+class BannerCache:
+    def __init__(self, widget, family=BANNER_FONT_FAMILY, sizes=BANNER_FONT_SIZES, margin=BANNER_MARGIN):
+        self.widget = widget
+        self.family = family
+        self.sizes = tuple(sorted(sizes, reverse=True))
+        self.margin = margin
+        self._fonts = {}
+        self._extents = {}
+        self.fit_size = lru_cache(maxsize=FIT_CACHE_SIZE)(self._fit_size)
+
+    def font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = tkfont.Font(root=self.widget, family=self.family, size=size)
+        return font
+
+    def extent(self, index, size):
+        """横幅 index 在 size 号字下的 (宽, 高)，单位为像素。"""
+        key = (index, size)
+        extent = self._extents.get(key)
+        if extent is None:
+            font = self.font(size)
+            lines = BANNERS[index].split("\n")
+            extent = self._extents[key] = (max(font.measure(line) for line in lines),
+                                           font.metrics("linespace") * len(lines))
+        return extent
+
+    def _fit_size(self, index, width, height):
+        # 横幅画在画布上方四分之一处，可用高度是上半部分减去边距
+        max_width = width - 2 * self.margin
+        max_height = height / 2 - self.margin
+        for size in self.sizes:
+            banner_width, banner_height = self.extent(index, size)
+            if banner_width <= max_width and banner_height <= max_height:
+                return size
+        return self.sizes[-1]
+
+
+class BannerImages(BannerCache):
+    """横幅预先渲染成的图片。
+
+    图片用 Pillow 找到的等宽字体绘制，字宽与 Tk 的 Courier 不同；fit_size 按同一个字体量尺寸，
+    选出的字号渲染出的图片不会超出可用区域（最小的字号也放不下时除外）。
+    """
+
+    def __init__(self, widget, max_entries=BANNER_IMAGE_CACHE_SIZE, font_files=BANNER_FONT_FILES, fill="black",
+                 sizes=BANNER_FONT_SIZES, margin=BANNER_MARGIN):
+        super().__init__(widget, sizes=sizes, margin=margin)
+        self.max_entries = max_entries
+        self.font_files = font_files
+        self.fill = fill
+        self._images = OrderedDict()
+        self._image_fonts = {}
+        self._font_file = None
+        self.available = None  # 第一次渲染时才检查 Pillow 和字体是否可用
+
+    def get(self, index, size):
+        """返回横幅 index 在 size 号字下的 PhotoImage，不能渲染时返回 None。"""
+        key = (index, size)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+        if self.available is False:
+            return None
+
+        image = self._render(BANNERS[index], size)
+        if image is None:
+            return None
+        self._images[key] = image
+        while len(self._images) > self.max_entries:
+            self._images.popitem(last=False)
+        return image
+
+    def _render(self, text, size):
+        font = self._font(size)
+        if font is None:
+            return None
+        from PIL import Image, ImageDraw, ImageTk
+
+        lines = text.split("\n")
+        image = Image.new("RGBA", _image_size(font, lines), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        line_height = sum(font.getmetrics())
+        for row, line in enumerate(lines):
+            draw.text((0, row * line_height), line, font=font, fill=self.fill)
+        return ImageTk.PhotoImage(image, master=self.widget)
+
+    def extent(self, index, size):
+        """横幅 index 在 size 号字下渲染出的图片尺寸；Pillow 或字体不可用时按 Tk 字体计算。"""
+        key = (index, size)
+        extent = self._extents.get(key)
+        if extent is None:
+            font = self._font(size)
+            if font is None:
+                return super().extent(index, size)
+            extent = self._extents[key] = _image_size(font, BANNERS[index].split("\n"))
+        return extent
+
+    def _font(self, size):
+        # Tk 的字号单位是点，换算成当前屏幕的像素，与文字图元用同样的字号
+        pixels = round(self.widget.winfo_fpixels(f"{size}p"))
+        font = self._image_fonts.get(pixels)
+        if font is not None:
+            return font
+        try:
+            from PIL import ImageFont
+        except ImportError:
+            self.available = False
+            return None
+
+        for font_file in ((self._font_file,) if self._font_file else self.font_files):
+            try:
+                font = ImageFont.truetype(font_file, pixels)
+            except OSError:
+                continue
+            self._font_file = font_file
+            self.available = True
+            self._image_fonts[pixels] = font
+            return font
+        self.available = False
+        return None
@@ -0,0 +1,223 @@
+"""app.py 的压测脚本。
+
+默认使用 Flask 测试客户端在进程内压测，也可以用 --url 压测已经启动的服务器
+（例如 python serve.py 或 python app.py）。结果写入 JSON 文件，便于比较多次运行：
+
+    python benchmarks/bench_app.py --output bench_app.json
+    python benchmarks/bench_app.py --no-cache --output bench_app_nocache.json
+    python benchmarks/bench_app.py --url http://127.0.0.1:8000 --concurrency 1 16 64
+    python benchmarks/bench_app.py --compare bench_app.json --tolerance 0.2
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# (名称, 方法, 表单)
+SCENARIOS = [
+    ("get_index", "GET", None),
+    ("post_valid_en", "POST", {"birth_date": "1990-05-01", "language": "English"}),
+    ("post_valid_cn", "POST", {"birth_date": "1990-05-01", "language": "中文"}),
+    ("post_invalid_en", "POST", {"birth_date": "1990-13-45", "language": "English"}),
+    ("post_invalid_cn", "POST", {"birth_date": "not-a-date", "language": "中文"}),
+]
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class TestClientTransport:
+    def __init__(self, use_cache=True):
+        import app
+
+        self.app = app.app
+        if not use_cache:
+            # 容量为 0 时每次写入都会立即被淘汰，每个请求都重新计算和渲染模板
+            app.result_cache.max_entries = 0
+        self._local = threading.local()
+
+    def request(self, method, form):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open("/", method=method, data=form)
+        response.get_data()
+        return response.status_code
+
+
+class HttpTransport:
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self._local = threading.local()
+
+    def request(self, method, form):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        body = urlencode(form) if form else None
+        try:
+            connection.request(method, "/", body=body, headers=FORM_HEADERS if form else {})
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            self._local.connection = None
+            raise
+        return response.status
+
+
+def run_scenario(transport, method, form, concurrency, requests):
+    per_worker = max(1, requests // concurrency)
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        for _ in range(per_worker):
+            started = time.perf_counter()
+            try:
+                status = transport.request(method, form)
+                failed = status >= 500
+            except (OSError, http.client.HTTPException):
+                failed = True
+            local.append(time.perf_counter() - started)
+            if failed:
+                with lock:
+                    errors[0] += 1
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def measure_allocations(transport, method, form, requests):
+    # 单线程单独测一遍，避免 tracemalloc 的开销影响延迟数据
+    transport.request(method, form)
+    tracemalloc.start()
+    try:
+        start_size = tracemalloc.get_traced_memory()[0]
+        peak_total = 0
+        for _ in range(requests):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            transport.request(method, form)
+            peak_total += tracemalloc.get_traced_memory()[1] - current
+        retained = tracemalloc.get_traced_memory()[0] - start_size
+    finally:
+        tracemalloc.stop()
+    return {
+        # 单个请求处理过程中 Python 堆的峰值增长
+        "alloc_peak_bytes_per_request": round(peak_total / requests, 1),
+        # 请求结束后仍未释放的内存（缓存、泄漏等）
+        "alloc_retained_bytes_per_request": round(retained / requests, 1),
+    }
+
+
+def compare(results, baseline_path, tolerance):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["scenario"], r["concurrency"]): r for r in json.load(f)["results"]}
+
+    regressions = []
+    for result in results:
+        old = baseline.get((result["scenario"], result["concurrency"]))
+        if old is None:
+            continue
+        if result["rps"] < old["rps"] * (1 - tolerance):
+            regressions.append(f"{result['scenario']} c={result['concurrency']}: "
+                               f"rps {old['rps']} -> {result['rps']}")
+        if result["p95_ms"] > old["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{result['scenario']} c={result['concurrency']}: "
+                               f"p95 {old['p95_ms']}ms -> {result['p95_ms']}ms")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the life weeks web app.")
+    parser.add_argument("--url", help="benchmark a running server instead of the in-process test client")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=2000, help="requests per scenario and concurrency level")
+    parser.add_argument("--alloc-requests", type=int, default=200,
+                        help="requests used to measure allocations (test client only)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="disable the home() result cache (test client only) to measure template rendering")
+    parser.add_argument("--output", default="bench_app.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="previous results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown for --compare")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    transport = HttpTransport(args.url) if args.url else TestClientTransport(use_cache=not args.no_cache)
+
+    results = []
+    for name, method, form in SCENARIOS:
+        allocations = {}
+        if not args.url:
+            allocations = measure_allocations(transport, method, form, args.alloc_requests)
+        for concurrency in args.concurrency:
+            result = {"scenario": name, "concurrency": concurrency}
+            result.update(run_scenario(transport, method, form, concurrency, args.requests))
+            result.update(allocations)
+            results.append(result)
+            print(f"{name:16} c={concurrency:<4} {result['rps']:>9} req/s  "
+                  f"p50 {result['p50_ms']:>8}ms  p95 {result['p95_ms']:>8}ms  p99 {result['p99_ms']:>8}ms  "
+                  f"errors {result['errors']}")
+
+    report = {
+        "meta": {
+            "target": args.url or "flask-test-client",
+            "result_cache": not args.no_cache,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "requests": args.requests,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"results written to {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
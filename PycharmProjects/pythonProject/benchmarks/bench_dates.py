@@ -0,0 +1,78 @@
+"""比较 datetime.strptime 与 dates.parse_date / parse_dates 的解析速度。
+
+    python benchmarks/bench_dates.py
+    python benchmarks/bench_dates.py --count 1000000 --distinct 500
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dates
+
+
+def make_inputs(count, distinct, invalid_ratio, seed):
+    rng = random.Random(seed)
+    pool = [f"{rng.randint(1930, 2020)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            for _ in range(distinct)]
+    texts = [rng.choice(pool) for _ in range(count)]
+    for index in rng.sample(range(count), int(count * invalid_ratio)):
+        texts[index] = rng.choice(["1990-02-30", "not-a-date", "1990/01/01", ""])
+    return texts
+
+
+def strptime_batch(texts):
+    results = []
+    for text in texts:
+        try:
+            results.append(datetime.strptime(text, "%Y-%m-%d"))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def parse_date_batch(texts):
+    results = []
+    for text in texts:
+        try:
+            results.append(dates.parse_date(text))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def timed(func, texts):
+    dates._parse.cache_clear()
+    started = time.perf_counter()
+    func(texts)
+    return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ISO date parsing.")
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=None,
+                        help="distinct dates in the input (default: all distinct, i.e. no cache reuse)")
+    parser.add_argument("--invalid-ratio", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    workloads = {
+        "batch": make_inputs(args.count, args.distinct or args.count, args.invalid_ratio, args.seed),
+        # 少量日期被反复查询，对应网页缓存场景
+        "cache": make_inputs(args.count, 200, args.invalid_ratio, args.seed),
+    }
+    for name, texts in workloads.items():
+        baseline = timed(strptime_batch, texts)
+        print(f"{name:6} strptime     {baseline:8.3f}s")
+        for label, func in (("parse_date", parse_date_batch), ("parse_dates", dates.parse_dates)):
+            elapsed = timed(func, texts)
+            print(f"{name:6} {label:12} {elapsed:8.3f}s  x{baseline / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
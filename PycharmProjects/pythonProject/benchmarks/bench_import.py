@@ -0,0 +1,92 @@
+"""检查不依赖界面的模块的导入耗时，并确认它们没有间接导入 tkinter。
+
+每个模块在新的解释器中导入若干次，取最快的一次。core 超出预算或任何模块导入了 tkinter 时退出码为 1，
+可以直接放进 CI：
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --budget-ms 15 --repeat 10
+    python benchmarks/bench_import.py --modules core bulk_csv app
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 这些模块会被网页服务和命令行工具导入，都不应该带上 tkinter
+DEFAULT_MODULES = ("core", "dates", "catalog", "reminders", "result_cache", "grid_render", "bulk_csv", "app")
+BUDGET_MODULE = "core"
+DEFAULT_BUDGET_MS = 10.0
+GUI_MODULES = ("tkinter", "_tkinter")
+# 可选的第三方依赖，没有安装时跳过用到它们的模块；其他导入错误一律算失败
+OPTIONAL_DEPENDENCIES = ("flask", "markupsafe", "numpy", "gevent", "PIL")
+MISSING_MODULE = re.compile(r"ModuleNotFoundError: No module named '([^']+)'")
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({{"ms": elapsed, "gui": [name for name in {gui!r} if name in sys.modules]}}))
+"""
+
+
+def measure(module, repeat):
+    """返回 (最快耗时毫秒, 被导入的界面模块)，导入失败时返回 None 和错误信息。"""
+    best = None
+    gui = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", PROBE.format(module=module, gui=GUI_MODULES)],
+                                cwd=PROJECT_DIR, capture_output=True, text=True)
+        if result.returncode != 0:
+            lines = result.stderr.strip().splitlines()
+            return None, lines[-1] if lines else f"exit code {result.returncode}"
+        sample = json.loads(result.stdout)
+        best = sample["ms"] if best is None else min(best, sample["ms"])
+        gui = sample["gui"]
+    return best, gui
+
+
+def missing_optional(error):
+    """导入失败是因为缺少可选的第三方依赖时返回依赖名，否则返回 None。"""
+    match = MISSING_MODULE.search(error)
+    if match and match.group(1).split(".")[0] in OPTIONAL_DEPENDENCIES:
+        return match.group(1)
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure import time of the GUI-free modules.")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"import time budget for {BUDGET_MODULE}")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        ms, detail = measure(module, args.repeat)
+        if ms is None:
+            # 缺少可选依赖（例如没有安装 Flask）时只提示；core 本身必须能导入
+            if module != BUDGET_MODULE and missing_optional(detail):
+                print(f"{module:<14} skipped: {detail}")
+            else:
+                print(f"{module:<14} FAIL {detail}")
+                failed = True
+            continue
+        status = "ok"
+        if detail:
+            status = f"FAIL imports {', '.join(detail)}"
+            failed = True
+        elif module == BUDGET_MODULE and ms > args.budget_ms:
+            status = f"FAIL over budget {args.budget_ms:.1f}ms"
+            failed = True
+        print(f"{module:<14} {ms:8.2f}ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""测量桌面程序的冷启动耗时。
+
+每次在新进程中启动程序，设置 LIFE_WEEKS_STARTUP 让它记下启动的各个时刻后自动退出（见 startup.py），
+所有时间都从启动子进程算起：
+
+    window       创建 Startup 之前的耗时，主要是导入模块和创建根窗口
+    first_paint  输入框第一次绘制
+    interactive  推迟的组件全部创建完成
+    animation    画布有了实际尺寸，首页动画开始
+
+需要图形界面（Linux 上可以用 xvfb-run）：
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --apps ASCII.py --runs 20 --output bench_startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from startup import STARTUP_ENV
+
+DEFAULT_APPS = ("main.py", "ASCII.py", "new.py")
+MARKS = ("window", "first_paint", "interactive", "animation")
+RUN_TIMEOUT = 30
+
+
+def run_once(app):
+    """启动一次 app，返回各时刻距启动子进程的毫秒数。"""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        env = dict(os.environ, **{STARTUP_ENV: path})
+        spawned = time.time()
+        subprocess.run([sys.executable, app], cwd=PROJECT_DIR, env=env, check=True, timeout=RUN_TIMEOUT,
+                       capture_output=True)
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+    finally:
+        os.remove(path)
+    sample = {"window": (report["created"] - spawned) * 1000}
+    for name, epoch in report["epoch"].items():
+        sample[name] = (epoch - spawned) * 1000
+    return sample
+
+
+def summarize(samples):
+    summary = {}
+    for mark in MARKS:
+        values = [sample[mark] for sample in samples if mark in sample]
+        if values:
+            summary[mark] = {"min_ms": round(min(values), 1), "median_ms": round(statistics.median(values), 1),
+                             "max_ms": round(max(values), 1)}
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold start of the desktop apps.")
+    parser.add_argument("--apps", nargs="+", default=DEFAULT_APPS)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--output", help="write the summary to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for app in args.apps:
+        try:
+            samples = [run_once(app) for _ in range(args.runs)]
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            stderr = (getattr(e, "stderr", None) or b"").decode(errors="replace").strip()
+            print(f"{app}: failed to start ({stderr.splitlines()[-1] if stderr else e})")
+            continue
+        results[app] = summarize(samples)
+        print(app)
+        for mark, stats in results[app].items():
+            print(f"  {mark:<12} min {stats['min_ms']:8.1f}ms  median {stats['median_ms']:8.1f}ms  "
+                  f"max {stats['max_ms']:8.1f}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "results": results}, f, indent=2)
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""从命令行批量计算 CSV 中每个出生日期已经度过和剩余的周数。
+
+输入按块流式读取，解析和计算分给进程池，结果按原顺序边算边写，内存占用与文件大小无关：
+
+    python bulk_csv.py birthdays.csv weeks.csv
+    python bulk_csv.py birthdays.csv weeks.csv --column birth_date --workers 8 --chunk-size 50000
+    python bulk_csv.py birthdays.csv - --no-header --column 0 > weeks.csv
+
+输出为原有列加上 weeks_lived、weeks_remaining 两列，无效日期对应的两列为空。
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+
+from core import TOTAL_WEEKS
+from dates import parse_dates
+
+DEFAULT_CHUNK_SIZE = 20000
+PROGRESS_INTERVAL = 2.0
+
+
+def read_chunks(rows, chunk_size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_chunk(rows, column, today_ordinal):
+    dates, _ = parse_dates([row[column] if column < len(row) else "" for row in rows])
+    output = []
+    for row, birth_date in zip(rows, dates):
+        if birth_date is None:
+            output.append(row + ["", ""])
+        else:
+            weeks_lived = (today_ordinal - birth_date.toordinal()) // 7
+            output.append(row + [weeks_lived, TOTAL_WEEKS - weeks_lived])
+    return output
+
+
+class Progress:
+    def __init__(self, stream=sys.stderr, interval=PROGRESS_INTERVAL):
+        self.stream = stream
+        self.interval = interval
+        self.rows = 0
+        self.started = time.perf_counter()
+        self._last_report = self.started
+
+    def add(self, rows):
+        self.rows += rows
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def report(self, final=False):
+        elapsed = time.perf_counter() - self.started
+        rate = self.rows / elapsed if elapsed else 0.0
+        label = "done" if final else "progress"
+        print(f"{label}: {self.rows} rows in {elapsed:.1f}s ({rate:,.0f} rows/s)", file=self.stream)
+
+
+def run(reader, writer, column, chunk_size, workers, today=None, progress=None):
+    today_ordinal = (today or date.today()).toordinal()
+    chunks = read_chunks(reader, chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            writer.writerows(process_chunk(chunk, column, today_ordinal))
+            if progress:
+                progress.add(len(chunk))
+        return
+
+    # 同时在途的块数有上限，读得再快也不会把整个文件堆进内存
+    max_pending = workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in chunks:
+            pending.append((len(chunk), pool.submit(process_chunk, chunk, column, today_ordinal)))
+            if len(pending) >= max_pending:
+                _write_oldest(pending, writer, progress)
+        while pending:
+            _write_oldest(pending, writer, progress)
+
+
+def _write_oldest(pending, writer, progress):
+    size, future = pending.popleft()
+    writer.writerows(future.result())
+    if progress:
+        progress.add(size)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compute weeks lived/remaining for every birth date in a CSV.")
+    parser.add_argument("input", help="input CSV path, or - for stdin")
+    parser.add_argument("output", help="output CSV path, or - for stdout")
+    parser.add_argument("--column", default="birth_date",
+                        help="birth date column: header name, or 0-based index with --no-header")
+    parser.add_argument("--no-header", action="store_true", help="input has no header row")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes; 1 computes in the main process")
+    parser.add_argument("--quiet", action="store_true", help="do not print progress to stderr")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        reader = csv.reader(source)
+        writer = csv.writer(target)
+
+        if args.no_header:
+            if not args.column.isdigit():
+                print(f"--no-header needs a 0-based column index, got {args.column!r}", file=sys.stderr)
+                return 2
+            column = int(args.column)
+        else:
+            header = next(reader, None)
+            if header is None:
+                return 0
+            if args.column.isdigit():
+                column = int(args.column)
+                if column >= len(header):
+                    print(f"column {column} out of range for header {header}", file=sys.stderr)
+                    return 2
+            elif args.column in header:
+                column = header.index(args.column)
+            else:
+                print(f"column {args.column!r} not found in header {header}", file=sys.stderr)
+                return 2
+            writer.writerow(header + ["weeks_lived", "weeks_remaining"])
+
+        progress = None if args.quiet else Progress()
+        run(reader, writer, column, args.chunk_size, args.workers, progress=progress)
+        if progress:
+            progress.report(final=True)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""界面文字的翻译目录，供 main.py、ASCII.py、new.py 和 app.py 共用。
+
+每种语言的文字放在 locales/<语言>.json 中，第一次用到某种语言时才读取并编译，之后常驻内存：
+
+    texts = get_catalog("English")
+    texts["title"]
+    texts["result_text"].format(weeks_lived=1800, weeks_remaining=2776)
+    texts.reminders
+"""
+import json
+import os
+import sys
+import threading
+from functools import lru_cache
+from string import Formatter
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+DEFAULT_LANGUAGE = "zh"
+
+# 各入口原有的语言名称（main.py 用 Chinese/English，ASCII.py 和网页用 中文/English）；
+# 新语言只需添加 locales/<语言>.json，直接用文件名作语言代码，不用在这里登记
+LANGUAGE_ALIASES = {
+    "cn": "zh",
+    "Chinese": "zh",
+    "中文": "zh",
+    "English": "en",
+}
+
+
+@lru_cache(maxsize=None)
+def available_languages(directory=LOCALE_DIR):
+    """directory 中有翻译文件的语言代码。"""
+    return frozenset(name[:-len(".json")] for name in os.listdir(directory) if name.endswith(".json"))
+
+
+def normalize_language(language, default=DEFAULT_LANGUAGE):
+    if language in available_languages():
+        return language
+    return LANGUAGE_ALIASES.get(language, default)
+
+
+class Template:
+    """预先编译的 str.format 模板，format 时只做一次 % 替换，不再重新解析格式串。"""
+
+    __slots__ = ("source", "fields", "_pattern")
+
+    def __init__(self, source):
+        self.source = source
+        pattern = []
+        fields = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            pattern.append(literal.replace("%", "%%"))
+            if field is None:
+                continue
+            if not field or spec or conversion:
+                raise ValueError(f"unsupported template field in {source!r}")
+            field = sys.intern(field)
+            fields.append(field)
+            pattern.append(f"%({field})s")
+        self.fields = tuple(fields)
+        self._pattern = "".join(pattern)
+
+    def format(self, **values):
+        return self._pattern % values
+
+    def __str__(self):
+        return self.source
+
+    def __repr__(self):
+        return f"Template({self.source!r})"
+
+
+class Catalog:
+    def __init__(self, language, texts):
+        self.language = language
+        self._texts = {}
+        for key, value in texts.items():
+            if isinstance(value, list):
+                value = tuple(value)
+            elif any(field for _, field, _, _ in Formatter().parse(value)):
+                value = Template(value)
+            self._texts[sys.intern(key)] = value
+        self.reminders = self._texts.get("reminders", ())
+
+    @classmethod
+    def load(cls, language, directory=LOCALE_DIR):
+        with open(os.path.join(directory, f"{language}.json"), encoding="utf-8") as f:
+            return cls(language, json.load(f))
+
+    def __getitem__(self, key):
+        return self._texts[key]
+
+    def get(self, key, default=None):
+        return self._texts.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._texts
+
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(language=DEFAULT_LANGUAGE, default=DEFAULT_LANGUAGE):
+    """返回 language 对应的目录；language 可以是别名，不认识的名称使用 default。"""
+    code = normalize_language(language, default)
+    catalog = _catalogs.get(code)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.get(code)
+            if catalog is None:
+                catalog = _catalogs[code] = Catalog.load(code)
+    return catalog
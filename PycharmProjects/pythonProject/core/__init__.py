@@ -0,0 +1,20 @@
+"""与界面无关的核心计算：周数、网格布局和颜色渐变。
+
+这里不导入 tkinter、Flask 或 numpy，桌面程序、网页服务和命令行工具都可以直接使用：
+
+    from core import TOTAL_WEEKS, calculate_weeks_lived, compute_layout
+"""
+from core.colors import (COLOR_MODES, EMPTY_COLOR, LIVED_COLOR, OUTLINE_COLOR, lived_bands, lived_cell_colors,
+                         lived_runs, palette, parse_hex, smooth_color_transition)
+from core.layout import (DETAIL_LEVELS, MIN_CELL_PIXELS, GridLayout, block_rects, cell_at, cell_rect,
+                         choose_detail, choose_grid, clip_to_view, compute_layout, grid_lines, range_rects,
+                         zoom_layout)
+from core.weeks import LIFE_EXPECTANCY_YEARS, TOTAL_WEEKS, WEEKS_PER_YEAR, calculate_weeks_lived
+
+__all__ = [
+    "COLOR_MODES", "EMPTY_COLOR", "LIVED_COLOR", "OUTLINE_COLOR", "lived_bands", "lived_cell_colors", "lived_runs",
+    "palette", "parse_hex", "smooth_color_transition",
+    "DETAIL_LEVELS", "MIN_CELL_PIXELS", "GridLayout", "block_rects", "cell_at", "cell_rect", "choose_detail",
+    "choose_grid", "clip_to_view", "compute_layout", "grid_lines", "range_rects", "zoom_layout",
+    "LIFE_EXPECTANCY_YEARS", "TOTAL_WEEKS", "WEEKS_PER_YEAR", "calculate_weeks_lived",
+]
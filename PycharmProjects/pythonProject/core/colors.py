@@ -0,0 +1,91 @@
+from functools import lru_cache
+
+from core.weeks import WEEKS_PER_YEAR
+
+# 格子的默认配色，桌面版和网页版共用
+LIVED_COLOR = "#008000"
+EMPTY_COLOR = "white"
+OUTLINE_COLOR = "black"
+
+# 已度过的周的着色方式：solid 为单一颜色；decade 按年龄每十年换一种颜色；intensity 随年龄分成更多段逐渐加深
+COLOR_MODES = ("solid", "decade", "intensity")
+GRADIENT_START = "#b8e0b8"
+GRADIENT_END = "#003300"
+WEEKS_PER_DECADE = 10 * WEEKS_PER_YEAR
+INTENSITY_STEPS = 16
+
+# 不同 (起点, 终点, 步数) 的色表数量有限，缓存足够覆盖所有入口
+PALETTE_CACHE_SIZE = 64
+BANDS_CACHE_SIZE = 32
+
+
+def parse_hex(color):
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def palette(start_color, end_color, step_count):
+    """从 start_color 到 end_color 线性插值的色表，包含首尾共 step_count + 1 个颜色。
+
+    结果按参数缓存，返回的元组在所有调用方之间共用，不要修改。
+    """
+    start_r, start_g, start_b = parse_hex(start_color)
+    end_r, end_g, end_b = parse_hex(end_color)
+    color_steps = []
+    for step in range(step_count + 1):
+        r = int(start_r + (end_r - start_r) * (step / step_count))
+        g = int(start_g + (end_g - start_g) * (step / step_count))
+        b = int(start_b + (end_b - start_b) * (step / step_count))
+        color_steps.append(f"#{r:02x}{g:02x}{b:02x}")
+    return tuple(color_steps)
+
+
+def smooth_color_transition(start_color, end_color, step_count):
+    """palette 的列表版本，调用方可以随意修改。"""
+    return list(palette(start_color, end_color, step_count))
+
+
+@lru_cache(maxsize=BANDS_CACHE_SIZE)
+def lived_bands(mode, total_weeks, weeks_per_cell=1, lived_color=LIVED_COLOR):
+    """已度过的格子按 mode 分成的颜色段 ((起始格, 结束格, 颜色), ...)，按格子下标递增并覆盖全部格子。
+
+    每格代表 weeks_per_cell 周时，格子按它的第一周所在的段着色。
+    """
+    total_cells = -(-total_weeks // weeks_per_cell)
+    if mode == "solid":
+        return ((0, total_cells, lived_color),)
+    if mode == "decade":
+        band_weeks = WEEKS_PER_DECADE
+        band_count = -(-total_weeks // band_weeks)
+    elif mode == "intensity":
+        band_count = INTENSITY_STEPS
+        band_weeks = -(-total_weeks // band_count)
+    else:
+        raise ValueError(f"unknown color mode {mode!r}")
+
+    bands = []
+    for band, color in enumerate(palette(GRADIENT_START, GRADIENT_END, max(band_count - 1, 1))):
+        start = -(-band * band_weeks // weeks_per_cell)
+        end = min(-(-(band + 1) * band_weeks // weeks_per_cell), total_cells)
+        if start < end:
+            bands.append((start, end, color))
+    return tuple(bands)
+
+
+@lru_cache(maxsize=BANDS_CACHE_SIZE)
+def lived_cell_colors(mode, total_weeks, weeks_per_cell=1, lived_color=LIVED_COLOR):
+    """每个格子已度过时的颜色，逐格着色时按下标直接取，与单色一样每格只查一次表。"""
+    colors = []
+    for start, end, color in lived_bands(mode, total_weeks, weeks_per_cell, lived_color):
+        colors.extend([color] * (end - start))
+    return tuple(colors)
+
+
+def lived_runs(mode, total_weeks, lived_cells, weeks_per_cell=1, lived_color=LIVED_COLOR):
+    """前 lived_cells 个格子按颜色分成的连续区间 (起始格, 结束格, 颜色)。"""
+    runs = []
+    for start, end, color in lived_bands(mode, total_weeks, weeks_per_cell, lived_color):
+        if start >= lived_cells:
+            break
+        runs.append((start, min(end, lived_cells), color))
+    return runs
@@ -0,0 +1,164 @@
+import math
+from collections import namedtuple
+from functools import lru_cache
+
+# 画布布局：行列数、格子边长以及格子区域左上角坐标
+GridLayout = namedtuple("GridLayout", "rows cols cell_size x0 y0 total_cells")
+
+# 宽高比量化精度，拖动窗口时相近的比例共用同一个缓存结果
+ASPECT_RATIO_PRECISION = 3
+
+# 细节层级：每个格子代表的周数，依次为一周、四周（约一个月，一年正好 13 格）、一年
+DETAIL_LEVELS = (1, 4, 52)
+# 格子边长小于这个像素数时网格线只剩噪点，改用更粗的层级
+MIN_CELL_PIXELS = 5
+
+
+def _grid_aspect(total_cells, rows):
+    cols = (total_cells + rows - 1) // rows
+    return cols / rows
+
+
+@lru_cache(maxsize=256)
+def _solve_grid(total_cells, aspect_ratio):
+    # cols / rows 随 rows 严格递减，二分找到最后一个 cols / rows >= aspect_ratio 的行数，
+    # 最优解只可能是它或者它的下一个行数
+    low, high = 1, total_cells
+    while low < high:
+        mid = (low + high + 1) // 2
+        if _grid_aspect(total_cells, mid) >= aspect_ratio:
+            low = mid
+        else:
+            high = mid - 1
+
+    best_rows = low
+    if low < total_cells:
+        below = abs(_grid_aspect(total_cells, low) - aspect_ratio)
+        above = abs(_grid_aspect(total_cells, low + 1) - aspect_ratio)
+        # 与逐行扫描保持一致：误差相同时取较小的行数
+        if above < below:
+            best_rows = low + 1
+
+    return best_rows, (total_cells + best_rows - 1) // best_rows
+
+
+def choose_grid(total_cells, aspect_ratio):
+    """返回最接近给定宽高比的 (rows, cols)。"""
+    if total_cells <= 0:
+        return 0, 0
+    return _solve_grid(total_cells, round(aspect_ratio, ASPECT_RATIO_PRECISION))
+
+
+def compute_layout(width, height, total_cells, margin=20):
+    """根据画布尺寸计算格子布局，画布过小时返回 None。"""
+    inner_width = width - 2 * margin
+    inner_height = height - 2 * margin
+
+    if inner_width <= 0 or inner_height <= 0 or total_cells <= 0:
+        return None
+
+    rows, cols = choose_grid(total_cells, inner_width / inner_height)
+    cell_size = min(inner_width / cols, inner_height / rows)
+
+    x0 = (inner_width - (cols * cell_size)) / 2 + margin
+    y0 = (inner_height - (rows * cell_size)) / 2 + margin
+    return GridLayout(rows, cols, cell_size, x0, y0, total_cells)
+
+
+def choose_detail(width, height, total_weeks, min_cell=MIN_CELL_PIXELS, levels=DETAIL_LEVELS):
+    """返回 (每格周数, 布局)：取格子边长不小于 min_cell 的最细层级，都不满足时取最粗的层级。"""
+    chosen = (levels[0], None)
+    for weeks_per_cell in levels:
+        layout = compute_layout(width, height, -(-total_weeks // weeks_per_cell))
+        if layout is None:
+            break
+        chosen = (weeks_per_cell, layout)
+        if layout.cell_size >= min_cell:
+            break
+    return chosen
+
+
+def zoom_layout(layout, x, y, factor):
+    """以画布坐标 (x, y) 为中心把布局放大 factor 倍，(x, y) 处的格子保持在原位。"""
+    return layout._replace(cell_size=layout.cell_size * factor,
+                           x0=x - (x - layout.x0) * factor,
+                           y0=y - (y - layout.y0) * factor)
+
+
+def clip_to_view(shapes, width, height):
+    """把矩形或水平、竖直线段 (x1, y1, x2, y2) 裁剪到画布范围内，完全不可见的丢弃。"""
+    clipped = []
+    for x1, y1, x2, y2 in shapes:
+        x1, y1, x2, y2 = max(x1, 0), max(y1, 0), min(x2, width), min(y2, height)
+        if x1 <= x2 and y1 <= y2:
+            clipped.append((x1, y1, x2, y2))
+    return clipped
+
+
+def cell_at(layout, x, y):
+    """画布坐标 (x, y) 所在格子的下标，不在任何格子上时返回 None。"""
+    col = math.floor((x - layout.x0) / layout.cell_size)
+    row = math.floor((y - layout.y0) / layout.cell_size)
+    if not (0 <= col < layout.cols and 0 <= row < layout.rows):
+        return None
+    index = row * layout.cols + col
+    return index if index < layout.total_cells else None
+
+
+def cell_rect(layout, index):
+    """第 index 个格子的矩形 (x1, y1, x2, y2)。"""
+    row, col = divmod(index, layout.cols)
+    x1 = layout.x0 + col * layout.cell_size
+    y1 = layout.y0 + row * layout.cell_size
+    return x1, y1, x1 + layout.cell_size, y1 + layout.cell_size
+
+
+def block_rects(layout, cell_count):
+    """前 cell_count 个格子合并成的矩形：整行部分一个，剩余的半行一个。"""
+    return range_rects(layout, 0, cell_count)
+
+
+def range_rects(layout, start, end):
+    """第 start 到 end - 1 个格子合并成的矩形，最多三个：开头的半行、中间的整行、结尾的半行。"""
+    x0, y0, cell_size, cols = layout.x0, layout.y0, layout.cell_size, layout.cols
+    start, end = max(0, start), min(end, layout.total_cells)
+    rects = []
+    if start >= end:
+        return rects
+    row, col = divmod(start, cols)
+    if col:
+        stop = min(end - row * cols, cols)
+        y1 = y0 + row * cell_size
+        rects.append((x0 + col * cell_size, y1, x0 + stop * cell_size, y1 + cell_size))
+        row += 1
+        if row * cols >= end:
+            return rects
+    full_rows, rest = divmod(end - row * cols, cols)
+    if full_rows:
+        rects.append((x0, y0 + row * cell_size, x0 + cols * cell_size, y0 + (row + full_rows) * cell_size))
+    if rest:
+        y1 = y0 + (row + full_rows) * cell_size
+        rects.append((x0, y1, x0 + rest * cell_size, y1 + cell_size))
+    return rects
+
+
+def grid_lines(layout):
+    """网格线段 (x1, y1, x2, y2)，最后一行不满时只画到有格子的位置。"""
+    x0, y0, cell_size, cols = layout.x0, layout.y0, layout.cell_size, layout.cols
+    full_rows, last_cols = divmod(layout.total_cells, cols)
+    full_bottom = y0 + full_rows * cell_size
+    right = x0 + cols * cell_size
+
+    lines = []
+    for row in range(full_rows + 1):
+        y = y0 + row * cell_size
+        lines.append((x0, y, right, y))
+    if last_cols:
+        y = full_bottom + cell_size
+        lines.append((x0, y, x0 + last_cols * cell_size, y))
+
+    for col in range(cols + 1):
+        x = x0 + col * cell_size
+        bottom = full_bottom + cell_size if last_cols and col <= last_cols else full_bottom
+        lines.append((x, y0, x, bottom))
+    return lines
@@ -0,0 +1,12 @@
+from datetime import datetime
+
+# 按 88 岁预期寿命、每年 52 周计算
+LIFE_EXPECTANCY_YEARS = 88
+WEEKS_PER_YEAR = 52
+TOTAL_WEEKS = LIFE_EXPECTANCY_YEARS * WEEKS_PER_YEAR
+
+
+def calculate_weeks_lived(birth_date, current_date=None):
+    """从 birth_date 到 current_date（默认现在）已经度过的整周数。"""
+    delta = (current_date or datetime.now()) - birth_date
+    return delta.days // 7
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+ISO_DATE_FORMAT = "%Y-%m-%d"
+INVALID_DATE = "invalid date"
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# 不同出生日期的数量有限（一百多年约四万个），解析结果可以长期缓存
+PARSE_CACHE_SIZE = 40000
+# 有效的 YYYY-MM-DD 最长 10 个字符；更长的输入直接判为无效，不进缓存，避免缓存被超长字符串撑大
+MAX_DATE_LENGTH = 10
+
+
+def _days_in_month(year, month):
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(text):
+    """按 strptime("%Y-%m-%d") 的规则解析日期，无效时返回 None，不抛异常。"""
+    # 绝大多数输入是标准的 YYYY-MM-DD，先走定长切片
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        year_text, month_text, day_text = text[:4], text[5:7], text[8:]
+    else:
+        parts = text.split("-")
+        if len(parts) != 3:
+            return None
+        year_text, month_text, day_text = parts
+
+    # strptime 的 %d 也接受用空格补齐的一位数。%Y 的 \d 与 isdecimal 一样匹配所有 Unicode 数字；
+    # %m 的正则只有 ASCII 数字，%d 只有 1x、2x 的第二位是 \d，其余位置都要求 ASCII
+    if len(day_text) == 2 and day_text[0] == " ":
+        day_text = day_text[1]
+    if (len(year_text) != 4 or not 1 <= len(month_text) <= 2 or not 1 <= len(day_text) <= 2
+            or not (month_text.isascii() and day_text[0].isascii() and (day_text.isascii() or day_text[0] in "12"))
+            or not (year_text.isdecimal() and month_text.isdecimal() and day_text.isdecimal())):
+        return None
+
+    year, month, day = int(year_text), int(month_text), int(day_text)
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= _days_in_month(year, month):
+        return None
+    return datetime(year, month, day)
+
+
+def parse_date(text):
+    """解析 YYYY-MM-DD，结果与 datetime.strptime(text, "%Y-%m-%d") 相同，无效时抛出 ValueError。"""
+    parsed = _parse(text) if isinstance(text, str) and len(text) <= MAX_DATE_LENGTH else None
+    if parsed is None:
+        raise ValueError(f"time data {text!r} does not match format {ISO_DATE_FORMAT!r}")
+    return parsed
+
+
+def parse_dates(texts):
+    """批量解析日期，返回 (dates, errors)。
+
+    dates 与输入一一对应，无效项为 None；errors 把无效项的下标映射到错误信息。
+    """
+    dates = []
+    errors = {}
+    append = dates.append
+    parse = _parse
+    for index, text in enumerate(texts):
+        parsed = parse(text) if isinstance(text, str) and len(text) <= MAX_DATE_LENGTH else None
+        append(parsed)
+        if parsed is None:
+            errors[index] = INVALID_DATE
+    return dates, errors
+
+
+def week_span(birth_date, week_index, weeks=1):
+    """出生后第 week_index 周（从 0 开始）起连续 weeks 周的第一天和最后一天。"""
+    start = birth_date + timedelta(weeks=week_index)
+    return start, start + timedelta(weeks=weeks, days=-1)
+
+
+def age_on(birth_date, day):
+    """day 当天的周岁。"""
+    return day.year - birth_date.year - ((day.month, day.day) < (birth_date.month, birth_date.day))
@@ -0,0 +1,77 @@
+import time
+
+DEFAULT_FPS = 33
+
+
+class FrameClock:
+    """所有画布动画共用的帧时钟。
+
+    只维护一条 after 链，每帧依次推进所有已注册的动画；某一帧处理超时后，
+    下一帧会把错过的帧数一并传给动画，由动画直接跳到对应状态，而不是补画每一帧。
+    """
+
+    def __init__(self, widget, fps=DEFAULT_FPS):
+        self.widget = widget
+        self.frame_interval = 1.0 / fps
+        self.max_catch_up = max(1, int(fps))
+        self.animations = {}
+        self._next_handle = 0
+        self._after_id = None
+        self._deadline = None
+
+        self.frames = 0
+        self.dropped_frames = 0
+        self.last_frame_cost = 0.0
+        self.total_frame_cost = 0.0
+
+    def register(self, callback):
+        """注册一个动画，callback(frames) 每帧被调用一次，frames 为需要推进的帧数。"""
+        self._next_handle += 1
+        handle = self._next_handle
+        self.animations[handle] = callback
+        if self._after_id is None:
+            self._deadline = time.perf_counter() + self.frame_interval
+            self._schedule()
+        return handle
+
+    def unregister(self, handle):
+        self.animations.pop(handle, None)
+        if not self.animations and self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def stats(self):
+        return {
+            "fps": round(1.0 / self.frame_interval, 2),
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "last_frame_ms": round(self.last_frame_cost * 1000, 3),
+            "avg_frame_ms": round(self.total_frame_cost * 1000 / self.frames, 3) if self.frames else 0.0,
+            "animations": len(self.animations),
+        }
+
+    def _schedule(self):
+        delay = max(1, int(round((self._deadline - time.perf_counter()) * 1000)))
+        self._after_id = self.widget.after(delay, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        started = time.perf_counter()
+
+        # 超出截止时间的部分按整帧计为丢帧，下一帧的截止时间仍按节拍对齐
+        skipped = max(0, int((started - self._deadline) / self.frame_interval))
+        self.dropped_frames += skipped
+        self._deadline += (skipped + 1) * self.frame_interval
+        # 落后太多（例如系统休眠）时最多只让动画追赶一秒
+        frames = min(skipped + 1, self.max_catch_up)
+
+        for callback in list(self.animations.values()):
+            callback(frames)
+
+        cost = time.perf_counter() - started
+        self.frames += 1
+        self.last_frame_cost = cost
+        self.total_frame_cost += cost
+
+        if self.animations and self._after_id is None:
+            self._schedule()
@@ -0,0 +1,69 @@
+import struct
+import zlib
+
+from core.colors import EMPTY_COLOR, LIVED_COLOR, OUTLINE_COLOR, lived_runs
+from core.layout import compute_layout, grid_lines, range_rects
+
+BACKGROUND_COLOR = "white"
+
+# 每个 SVG 片段最多包含的网格线段数
+SVG_LINES_PER_CHUNK = 256
+
+
+def _fmt(value):
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def iter_svg(weeks_lived, total_weeks, width, height, lived_color=LIVED_COLOR, empty_color=EMPTY_COLOR,
+             outline=OUTLINE_COLOR, background=BACKGROUND_COLOR, color_mode="solid"):
+    """逐段生成格子的 SVG 文本，可直接作为流式响应返回；color_mode 见 core.colors.COLOR_MODES。"""
+    yield (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+           f'viewBox="0 0 {width} {height}">'
+           f'<rect width="100%" height="100%" fill="{background}"/>')
+
+    layout = compute_layout(width, height, total_weeks)
+    if layout is not None:
+        runs = [(0, total_weeks, empty_color)] + lived_runs(color_mode, total_weeks, weeks_lived,
+                                                            lived_color=lived_color)
+        for start, end, color in runs:
+            for x1, y1, x2, y2 in range_rects(layout, start, end):
+                yield (f'<rect x="{_fmt(x1)}" y="{_fmt(y1)}" width="{_fmt(x2 - x1)}" '
+                       f'height="{_fmt(y2 - y1)}" fill="{color}"/>')
+
+        # 网格线合并成 path，按块输出避免一次拼出很长的字符串
+        lines = grid_lines(layout)
+        for start in range(0, len(lines), SVG_LINES_PER_CHUNK):
+            commands = "".join(f"M{_fmt(x1)} {_fmt(y1)}L{_fmt(x2)} {_fmt(y2)}"
+                               for x1, y1, x2, y2 in lines[start:start + SVG_LINES_PER_CHUNK])
+            yield f'<path d="{commands}" stroke="{outline}" stroke-width="1" fill="none"/>'
+
+    yield "</svg>"
+
+
+def _png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(pixels):
+    """把 (height, width, 3) 的 uint8 数组编码为 PNG。"""
+    import numpy as np
+
+    height, width = pixels.shape[:2]
+    # 每行前加一个字节的过滤类型 0
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, width * 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)) + _png_chunk(b"IEND", b""))
+
+
+def render_png(weeks_lived, total_weeks, width, height, lived_color=LIVED_COLOR, empty_color=EMPTY_COLOR,
+               outline=OUTLINE_COLOR, background=BACKGROUND_COLOR, color_mode="solid"):
+    # 只有生成 PNG 时才需要 NumPy
+    import raster
+
+    layout = compute_layout(width, height, total_weeks)
+    pixels = raster.render_grid(layout, weeks_lived, width, height, lived_color=lived_color,
+                                empty_color=empty_color, outline=outline, background=background,
+                                lived_runs=lived_runs(color_mode, total_weeks, weeks_lived, lived_color=lived_color))
+    return encode_png(pixels)
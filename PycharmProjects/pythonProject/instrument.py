@@ -0,0 +1,188 @@
+"""Tk 界面热点路径的可选性能统计。
+
+默认关闭，此时不替换任何方法，没有额外开销。启动前设置环境变量即可打开：
+
+    LIFE_WEEKS_PROFILE=profile.json python main.py          # 退出时把统计写入 JSON
+    LIFE_WEEKS_PROFILE=overlay python ASCII.py              # 在画布右上角实时显示
+    LIFE_WEEKS_PROFILE=overlay,profile.json python new.py
+
+统计内容：各方法的调用次数和耗时直方图、画布图元数、after 回调的延迟，以及帧时钟的丢帧数据。
+"""
+import atexit
+import bisect
+import functools
+import json
+import os
+import platform
+import time
+
+PROFILE_ENV = "LIFE_WEEKS_PROFILE"
+
+# 耗时直方图各个桶的上界（毫秒），最后一个桶收集更慢的调用
+HISTOGRAM_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+# 每隔多久用一个 after 回调探测一次事件循环延迟，并顺便统计画布图元数
+LAG_PROBE_MS = 100
+OVERLAY_REFRESH_MS = 500
+OVERLAY_TAG = "profile_overlay"
+OVERLAY_ROWS = 8
+
+# 各入口共用的方法名，某个入口没有的方法会被跳过
+APP_METHODS = ("update_canvas", "on_resize", "complete_resize", "update_ui_texts", "update_ui_language",
+               "update_reminder_text", "update_week_label", "update_font_sizes", "update_ui_font_size")
+ANIMATION_METHODS = ("_fill_cells", "_animate_initial_canvas", "restart_animation", "draw_banner")
+
+
+class Histogram:
+    def __init__(self, bounds=HISTOGRAM_BUCKETS_MS):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.buckets[bisect.bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, fraction):
+        """按桶估计的分位数：返回所在桶的上界，落在最后一个桶时返回最大值。"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "avg_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "max_ms": round(self.max, 3),
+            "buckets_ms": {label: count for label, count in zip(labels, self.buckets) if count},
+        }
+
+
+class Profiler:
+    def __init__(self, output=None, overlay=False):
+        self.output = output
+        self.overlay = overlay
+        self.timings = {}
+        self.after_lag = Histogram()
+        self.items_last = 0
+        self.items_max = 0
+        self.started = time.perf_counter()
+
+        self.root = None
+        self.canvas = None
+        self.frame_clock = None
+        self._probe_due = None
+
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        """按 LIFE_WEEKS_PROFILE 创建 Profiler，没有设置时返回 None。"""
+        parts = [part.strip() for part in environ.get(PROFILE_ENV, "").split(",") if part.strip()]
+        if not parts:
+            return None
+        outputs = [part for part in parts if part != "overlay"]
+        return cls(output=outputs[0] if outputs else None, overlay="overlay" in parts)
+
+    def instrument(self, cls, names):
+        """把 cls 上的这些方法换成计时版本，要在创建实例之前调用，事件绑定才会用到计时版本。"""
+        for name in names:
+            # 也包括从 mixin 继承的方法，计时版本设置在 cls 上
+            method = getattr(cls, name, None)
+            if method is not None:
+                setattr(cls, name, self._timed(f"{cls.__name__}.{name}", method))
+
+    def attach(self, root, canvas, frame_clock=None):
+        """开始探测 after 回调延迟和画布图元数，按配置显示浮层，并在退出时写出 JSON。"""
+        self.root = root
+        self.canvas = canvas
+        self.frame_clock = frame_clock
+        self._probe_due = time.perf_counter() + LAG_PROBE_MS / 1000
+        root.after(LAG_PROBE_MS, self._probe)
+        if self.overlay:
+            root.after(OVERLAY_REFRESH_MS, self._refresh_overlay)
+        if self.output:
+            atexit.register(self.dump, self.output)
+
+    def report(self):
+        return {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "uptime_s": round(time.perf_counter() - self.started, 3),
+            },
+            "timings": {label: histogram.to_dict() for label, histogram in self.timings.items()},
+            "after_lag": self.after_lag.to_dict(),
+            "canvas_items": {"last": self.items_last, "max": self.items_max},
+            "frame_clock": self.frame_clock.stats() if self.frame_clock else None,
+        }
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+
+    def _timed(self, label, func):
+        histogram = self.timings.setdefault(label, Histogram())
+        perf_counter = time.perf_counter
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.add((perf_counter() - started) * 1000)
+
+        return timed
+
+    def _probe(self):
+        now = time.perf_counter()
+        self.after_lag.add(max(0.0, (now - self._probe_due) * 1000))
+        self._count_items()
+        self._probe_due = now + LAG_PROBE_MS / 1000
+        self.root.after(LAG_PROBE_MS, self._probe)
+
+    def _count_items(self):
+        canvas = self.canvas
+        count = len(canvas.find_all()) - len(canvas.find_withtag(OVERLAY_TAG))
+        self.items_last = count
+        self.items_max = max(self.items_max, count)
+
+    def _overlay_text(self):
+        lines = [f"items {self.items_last} (max {self.items_max})  "
+                 f"after lag p95 {self.after_lag.percentile(0.95):.1f}ms max {self.after_lag.max:.1f}ms"]
+        if self.frame_clock:
+            stats = self.frame_clock.stats()
+            lines.append(f"frames {stats['frames']}  dropped {stats['dropped_frames']}  "
+                         f"avg {stats['avg_frame_ms']}ms")
+        busiest = sorted(self.timings.items(), key=lambda item: item[1].total, reverse=True)
+        for label, histogram in busiest[:OVERLAY_ROWS]:
+            if histogram.count:
+                lines.append(f"{label.split('.', 1)[1]:<24} n={histogram.count:<6} "
+                             f"avg {histogram.total / histogram.count:6.2f}ms  max {histogram.max:7.2f}ms")
+        return "\n".join(lines)
+
+    def _refresh_overlay(self):
+        canvas = self.canvas
+        x = canvas.winfo_width() - 10
+        items = canvas.find_withtag(OVERLAY_TAG)
+        if items:
+            canvas.coords(items[0], x, 10)
+            canvas.itemconfig(items[0], text=self._overlay_text())
+        else:
+            canvas.create_text(x, 10, text=self._overlay_text(), anchor="ne", justify="left",
+                               font=("Courier", 9), fill="#555555", tags=OVERLAY_TAG)
+        canvas.tag_raise(OVERLAY_TAG)
+        self.root.after(OVERLAY_REFRESH_MS, self._refresh_overlay)
@@ -1,173 +1,35 @@
 import tkinter as tk
+import tkinter.font as tkfont
 from datetime import datetime
-import random
 
-
-class AnimationManager:
-    def __init__(self, canvas):
-        self.canvas = canvas
-        self.animation_running = False
-        self.current_animation_id = None
-        self.current_step = 0
-        self.current_intensity = 0
-        self.color_transition_steps = self.smooth_color_transition("#FFFFFF", "#008000", 10)
-
-    def start_animation(self):
-        if self.animation_running:
-            return
-        self.animation_running = True
-        self.current_step = 0
-        self.current_intensity = 0
-        self._animate_initial_canvas()
-
-    def stop_animation(self):
-        self.animation_running = False
-        if self.current_animation_id:
-            self.canvas.after_cancel(self.current_animation_id)
-        self.canvas.delete("all")
-
-    def _animate_initial_canvas(self):
-        self.canvas.delete("all")
-        margin = 20
-        inner_width = self.canvas.winfo_width() - 2 * margin
-        inner_height = self.canvas.winfo_height() - 2 * margin
-
-        if inner_width <= 0 or inner_height <= 0:
-            return
-
-        cols = 23
-        rows = 1
-        cell_size_width = inner_width / cols
-        cell_size_height = inner_height / rows
-        cell_size = min(cell_size_width, cell_size_height)
-
-        new_margin_horizontal = (inner_width - (cols * cell_size)) / 2 + margin
-        new_margin_vertical = (inner_height - (rows * cell_size)) / 2 + margin
-
-        for row in range(rows):
-            for col in range(cols):
-                x1 = new_margin_horizontal + col * cell_size
-                y1 = new_margin_vertical + row * cell_size
-                x2 = x1 + cell_size
-                y2 = y1 + cell_size
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="black")
-
-        self._fill_cells(new_margin_horizontal, new_margin_vertical, cell_size, rows, cols)
-
-    def _fill_cells(self, margin_x, margin_y, cell_size, rows, cols):
-        if not self.animation_running:
-            return
-
-        if self.current_step >= rows * cols:
-            self.restart_animation()
-            return
-
-        row = self.current_step // cols
-        col = self.current_step % cols
-        x1 = margin_x + col * cell_size
-        y1 = margin_y + row * cell_size
-        x2 = x1 + cell_size
-        y2 = y1 + cell_size
-
-        if self.current_intensity < len(self.color_transition_steps):
-            color = self.color_transition_steps[self.current_intensity]
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
-            self.current_intensity += 1
-            self.current_animation_id = self.canvas.after(30, self._fill_cells, margin_x, margin_y, cell_size, rows,
-                                                          cols)
-        else:
-            self.current_step += 1
-            self.current_intensity = 0
-            self.current_animation_id = self.canvas.after(30, self._fill_cells, margin_x, margin_y, cell_size, rows,
-                                                          cols)
-
-    def restart_animation(self):
-        self.current_step = 0
-        self.current_intensity = 0
-        self.animation_running = True
-        self._animate_initial_canvas()
-
-    @staticmethod
-    def smooth_color_transition(start_color, end_color, step_count):
-        start_r, start_g, start_b = tuple(int(start_color[i:i + 2], 16) for i in (1, 3, 5))
-        end_r, end_g, end_b = tuple(int(end_color[i:i + 2], 16) for i in (1, 3, 5))
-        color_steps = []
-        for step in range(step_count + 1):
-            r = int(start_r + (end_r - start_r) * (step / step_count))
-            g = int(start_g + (end_g - start_g) * (step / step_count))
-            b = int(start_b + (end_b - start_b) * (step / step_count))
-            color_steps.append(f"#{r:02x}{g:02x}{b:02x}")
-        return color_steps
+from catalog import get_catalog
+from core import TOTAL_WEEKS, calculate_weeks_lived
+from dates import parse_date
+from frame_clock import FrameClock
+from instrument import ANIMATION_METHODS, APP_METHODS, Profiler
+from reminders import ReminderSampler
+from startup import Startup
+from week_grid import AnimationManager, CanvasResizeMixin, WeekDetailsMixin, WeekGrid, renderer_from_env
 
 
 class LanguageManager:
     def __init__(self):
         self.language = 'Chinese'
-        self.translations = {
-            'Chinese': {
-                'title': "人生周数提醒器",
-                'birth_label': "请输入你的出生日期 (YYYY-MM-DD):",
-                'submit_button': "提交",
-                'home_button': "首页",
-                'language_button': "语言",
-                'font_size_button': "字号",
-                'reminders': [
-                    "人生短暂，不要让拖延成为你的常态。",
-                    "每一周都是宝贵的，不要浪费时间拖延！",
-                    "现在的每一个决定，决定了未来的你。",
-                    "你可以选择拖延，也可以选择现在行动，做出改变。",
-                    "今天做的事，决定你明天的自由。",
-                    "未来属于那些今天行动的人，别让拖延阻挡你。",
-                    "拖延只能让时间流逝得更快。",
-                    "你看看还有多少周可以浪费？不要再拖延了！",
-                    "时间不会等待，抓住现在才能把握未来。",
-                    "别再拖延了，否则这些小格子只能越来越少了！",
-                    "时间在走，人生的进度条不会等你，赶快行动吧！",
-                    "如果你总是拖延，连这些格子都等不及了！",
-                    "今天的行动会改变你的明天，不要让拖延成为你前进的障碍。",
-                    "每周一个小进步，累积起来就是巨大的成就，别拖延哦！",
-                    "时间很快就溜走，珍惜每一周，让自己变得更好。"
-                ],
-                'result_text': "你已经度过了 {weeks_lived} 周，剩余大约 {weeks_remaining} 周。",
-                'invalid_date': "请输入有效的出生日期 (格式: YYYY-MM-DD)"
-            },
-            'English': {
-                'title': "Life Weeks Reminder",
-                'birth_label': "Please enter your birth date (YYYY-MM-DD):",
-                'submit_button': "Submit",
-                'home_button': "Home",
-                'language_button': "Language",
-                'font_size_button': "Font Size",
-                'reminders': [
-                    "Life is short, don’t let procrastination be your norm.",
-                    "Every week is precious, don't waste time procrastinating!",
-                    "Every decision you make today shapes your future.",
-                    "You can choose to procrastinate, or you can choose to act now and make a change.",
-                    "What you do today determines your freedom tomorrow.",
-                    "The future belongs to those who act today, don't let procrastination hold you back.",
-                    "Every week you age a little more, procrastination only makes time pass faster.",
-                    "How many 88-year weeks do you have to waste? Don't procrastinate!",
-                    "Time doesn't wait, seize the moment to shape your future.",
-                    "Stop procrastinating, or these squares will keep getting fewer!",
-                    "Time is ticking, and the progress bar of life won't wait for you, take action now!",
-                    "If you keep procrastinating, even these squares can’t wait any longer!",
-                    "Today's actions will change your tomorrow, don't let procrastination be your barrier.",
-                    "A small improvement each week will accumulate to great achievements, don't procrastinate!",
-                    "Time slips away quickly, cherish each week, and make yourself better."
-                ],
-                'result_text': "You have lived {weeks_lived} weeks, approximately {weeks_remaining} weeks remaining.",
-                'invalid_date': "Please enter a valid birth date (Format: YYYY-MM-DD)"
-            }
-        }
+        self.catalog = get_catalog(self.language)
+        self.reminder_sampler = ReminderSampler()
 
     def toggle_language(self):
         self.language = 'English' if self.language == 'Chinese' else 'Chinese'
+        self.catalog = get_catalog(self.language)
 
     def get_translation(self, key):
-        return self.translations[self.language][key]
+        return self.catalog[key]
 
+    def next_reminder(self):
+        return self.reminder_sampler.draw(self.language)
 
-class LifeWeeksApp:
+
+class LifeWeeksApp(CanvasResizeMixin, WeekDetailsMixin):
     def __init__(self, root):
         self.root = root
         self.language_manager = LanguageManager()
@@ -177,16 +39,26 @@ class LifeWeeksApp:
 
         self.user_birth_date = None
         self.weeks_lived = 0
-        self.total_weeks = 88 * 52
-        self.resize_in_progress = False
+        self.total_weeks = TOTAL_WEEKS
+        self.pinned_week = None
+        self.shown_week = None
         self.reminder_paused = False
         self.font_size = "medium"  # 默认字体大小为中等
 
+        # 先创建按钮和输入框，窗口画出来后再在空闲时创建画布和其余组件
+        self.startup = Startup.from_env(self.root)
         self.create_widgets()
-        self.animation_manager = AnimationManager(self.canvas)
-        self.root.after(100, self.animation_manager.start_animation)
+        self.startup.defer(self.create_canvas)
+        self.startup.start(self.birth_entry)
+        self.birth_entry.focus_set()
 
     def create_widgets(self):
+        # 共用的命名字体：改字号时每种字体只需 configure 一次，所有使用它的组件一起重新布局
+        self.button_font = tkfont.Font(root=self.root, family="微软雅黑", size=12)
+        self.body_font = tkfont.Font(root=self.root, family="微软雅黑", size=16)
+        self.reminder_font = tkfont.Font(root=self.root, family="微软雅黑", size=18, slant="italic")
+        self.result_font = tkfont.Font(root=self.root, family="微软雅黑", size=14)
+
         # 顶部框架，包含按钮
         top_frame = tk.Frame(self.root)
         top_frame.pack(pady=5, padx=10, anchor="n", fill="x")
@@ -194,10 +66,15 @@ class LifeWeeksApp:
         # 按钮框架在右上角
         button_frame = tk.Frame(top_frame)
         button_frame.pack(side="right")
-        self.submit_button = tk.Button(button_frame, command=self.on_submit_click, font=("微软雅黑", 12))
-        self.home_button = tk.Button(button_frame, command=self.back_to_home, font=("微软雅黑", 12))
-        self.language_button = tk.Button(button_frame, command=self.toggle_language, font=("微软雅黑", 12))
-        self.font_size_button = tk.Button(button_frame, command=self.toggle_font_size, font=("微软雅黑", 12))
+        texts = self.language_manager.catalog
+        self.submit_button = tk.Button(button_frame, text=texts['submit_button'], command=self.on_submit_click,
+                                       font=self.button_font)
+        self.home_button = tk.Button(button_frame, text=texts['home_button'], command=self.back_to_home,
+                                     font=self.button_font)
+        self.language_button = tk.Button(button_frame, text=texts['language_button'], command=self.toggle_language,
+                                         font=self.button_font)
+        self.font_size_button = tk.Button(button_frame, text=texts['font_size_button'],
+                                          command=self.toggle_font_size, font=self.button_font)
 
         self.submit_button.pack(side="left", padx=5)
         self.home_button.pack(side="left", padx=5)
@@ -208,13 +85,14 @@ class LifeWeeksApp:
         center_frame = tk.Frame(self.root)
         center_frame.pack(pady=5)
 
-        self.birth_label = tk.Label(center_frame, font=("微软雅黑", 16))
-        self.birth_entry = tk.Entry(center_frame, font=("微软雅黑", 16))
+        self.birth_label = tk.Label(center_frame, text=texts['birth_label'], font=self.body_font)
+        self.birth_entry = tk.Entry(center_frame, font=self.body_font)
         self.birth_label.pack(side="left", padx=(0, 5))
         self.birth_entry.pack(side="left", padx=(0, 10))
 
+    def create_canvas(self):
         # 提醒标签
-        self.reminder_label = tk.Label(self.root, font=("微软雅黑", 18, "italic"), fg="blue")
+        self.reminder_label = tk.Label(self.root, font=self.reminder_font, fg="blue")
         self.reminder_label.pack(pady=(5, 10))
         self.reminder_label.bind("<Button-1>", self.toggle_reminder_pause)
 
@@ -224,11 +102,21 @@ class LifeWeeksApp:
         self.canvas = tk.Canvas(canvas_frame, bg="white")
         self.canvas.pack(side="left", fill="both", expand=True)
         self.canvas.bind("<Configure>", self.on_resize)
+        self.bind_week_events()
 
         # 结果标签
-        self.result_label = tk.Label(self.root, font=("微软雅黑", 14))
+        self.result_label = tk.Label(self.root, font=self.result_font)
         self.result_label.pack(pady=5)
 
+        # 鼠标所在周的日期范围和年龄
+        self.week_label = tk.Label(self.root, text="", font=self.result_font, fg="gray")
+        self.week_label.pack(pady=(0, 5))
+
+        # 渲染方式默认为 auto，可以用 LIFE_WEEKS_RENDERER 指定，见 week_grid.py
+        self.week_grid = WeekGrid(self.canvas, renderer=renderer_from_env())
+        self.frame_clock = FrameClock(self.root)
+        # 首页动画在画布第一次有实际尺寸时开始，见 on_resize
+        self.animation_manager = AnimationManager(self.canvas, self.frame_clock)
         self.update_ui_texts()
 
     def update_ui_texts(self):
@@ -238,32 +126,31 @@ class LifeWeeksApp:
         self.home_button.config(text=self.language_manager.get_translation('home_button'))
         self.language_button.config(text=self.language_manager.get_translation('language_button'))
         self.font_size_button.config(text=self.language_manager.get_translation('font_size_button'))
+        self.update_week_label()
 
         if not self.reminder_paused:
-            self.current_reminder = random.choice(self.language_manager.get_translation('reminders'))
+            self.current_reminder = self.language_manager.next_reminder()
             self.reminder_label.config(text=self.current_reminder)
 
-    def calculate_weeks_lived(self, birth_date, current_date):
-        delta = current_date - birth_date
-        return delta.days // 7
-
     def on_submit_click(self):
+        self.startup.finish()
         if not self.reminder_paused:
-            self.current_reminder = random.choice(self.language_manager.get_translation('reminders'))
+            self.current_reminder = self.language_manager.next_reminder()
             self.reminder_label.config(text=self.current_reminder)
 
         birth_date_str = self.birth_entry.get()
         try:
-            self.user_birth_date = datetime.strptime(birth_date_str, "%Y-%m-%d")
+            self.user_birth_date = parse_date(birth_date_str)
         except ValueError:
             self.result_label.config(text=self.language_manager.get_translation('invalid_date'))
             return
 
         # 停止首页动画
         self.animation_manager.stop_animation()
+        self.reset_week_details()
 
         current_date = datetime.now()
-        self.weeks_lived = self.calculate_weeks_lived(self.user_birth_date, current_date)
+        self.weeks_lived = calculate_weeks_lived(self.user_birth_date, current_date)
         weeks_remaining = self.total_weeks - self.weeks_lived
         self.result_label.config(
             text=self.language_manager.get_translation('result_text').format(weeks_lived=self.weeks_lived,
@@ -271,74 +158,39 @@ class LifeWeeksApp:
         self.update_canvas(self.weeks_lived, self.total_weeks)
 
     def update_canvas(self, weeks_lived, total_weeks):
-        self.canvas.delete("all")
-        margin = 20
-        inner_width = self.canvas.winfo_width() - 2 * margin
-        inner_height = self.canvas.winfo_height() - 2 * margin
-
-        if inner_width <= 0 or inner_height <= 0:
-            return
-
-        aspect_ratio = inner_width / inner_height
-        total_cells = total_weeks
-
-        best_rows, best_cols = 1, total_cells
-        min_empty_space = float('inf')
-
-        for rows in range(1, total_cells + 1):
-            cols = (total_cells + rows - 1) // rows
-            calculated_aspect_ratio = cols / rows
-            empty_space = abs(calculated_aspect_ratio - aspect_ratio)
-
-            if empty_space < min_empty_space:
-                min_empty_space = empty_space
-                best_rows, best_cols = rows, cols
-
-        rows, cols = best_rows, best_cols
-        cell_size_width = inner_width / cols
-        cell_size_height = inner_height / rows
-        cell_size = min(cell_size_width, cell_size_height)
-
-        new_margin_horizontal = (inner_width - (cols * cell_size)) / 2 + margin
-        new_margin_vertical = (inner_height - (rows * cell_size)) / 2 + margin
-
-        for row in range(rows):
-            for col in range(cols):
-                week_index = row * cols + col
-                if week_index >= total_weeks:
-                    break
-                x1 = new_margin_horizontal + col * cell_size
-                y1 = new_margin_vertical + row * cell_size
-                x2 = x1 + cell_size
-                y2 = y1 + cell_size
-                color = "#008000" if week_index < weeks_lived else "white"
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
+        self.week_grid.draw(weeks_lived, total_weeks)
 
     def back_to_home(self):
+        self.startup.finish()
         self.result_label.config(text="")
         self.user_birth_date = None
         self.weeks_lived = 0
         self.animation_manager.stop_animation()
+        self.reset_week_details()
+        self.week_grid.clear()
         self.animation_manager.start_animation()
         if not self.reminder_paused:
-            self.current_reminder = random.choice(self.language_manager.get_translation('reminders'))
+            self.current_reminder = self.language_manager.next_reminder()
             self.reminder_label.config(text=self.current_reminder)
 
+    def week_detail_template(self):
+        return self.language_manager.get_translation('week_detail')
+
     def toggle_reminder_pause(self, event):
         self.reminder_paused = not self.reminder_paused
-        current_font = self.reminder_label.cget("font")
-        font_family, font_size, *font_styles = current_font.split() if isinstance(current_font, str) else (
-        "微软雅黑", 18, "italic")
         if self.reminder_paused:
-            self.reminder_label.config(font=(font_family, int(font_size), "bold"), fg="red")
+            self.reminder_font.configure(slant="roman", weight="bold")
+            self.reminder_label.config(fg="red")
         else:
-            self.reminder_label.config(font=(font_family, int(font_size), "italic"), fg="blue")
+            self.reminder_font.configure(slant="italic", weight="normal")
+            self.reminder_label.config(fg="blue")
 
     def toggle_language(self):
+        self.startup.finish()
         self.language_manager.toggle_language()
         self.update_ui_texts()
         if not self.reminder_paused:
-            self.current_reminder = random.choice(self.language_manager.get_translation('reminders'))
+            self.current_reminder = self.language_manager.next_reminder()
             self.reminder_label.config(text=self.current_reminder)
 
     def toggle_font_size(self):
@@ -348,6 +200,7 @@ class LifeWeeksApp:
             self.font_size = "large"
         else:
             self.font_size = "small"
+        self.startup.finish()
 
         # 更新字体大小并更新UI文本
         self.update_font_sizes()
@@ -355,45 +208,29 @@ class LifeWeeksApp:
 
     def update_font_sizes(self):
         font_sizes = {
-            "small": ("微软雅黑", 12),
-            "medium": ("微软雅黑", 16),
-            "large": ("微软雅黑", 20)
+            "small": 12,
+            "medium": 16,
+            "large": 20
         }
 
         size = font_sizes[self.font_size]
 
-        # 按钮字体保持不变
-        self.submit_button.config(font=("微软雅黑", 12))
-        self.home_button.config(font=("微软雅黑", 12))
-        self.language_button.config(font=("微软雅黑", 12))
-        self.font_size_button.config(font=("微软雅黑", 12))
-
-        # 其他组件字体随大小变化
-        self.birth_label.config(font=size)
-        self.birth_entry.config(font=size)
-        reminder_font = (size[0], size[1] + 2 if size[1] > 12 else size[1], "italic") if not self.reminder_paused else (
-        size[0], size[1] + 2 if size[1] > 12 else size[1], "bold")
-        self.reminder_label.config(font=reminder_font)
-        self.result_label.config(font=size)
-
-    def on_resize(self, event):
-        if self.resize_in_progress:
-            return
-        self.resize_in_progress = True
-
-        def complete_resize():
-            self.resize_in_progress = False
-            if self.animation_manager.animation_running:
-                self.animation_manager.stop_animation()
-                self.animation_manager.start_animation()
-            elif self.user_birth_date:
-                self.update_canvas(self.weeks_lived, self.total_weeks)
-
-        self.canvas.after(100, complete_resize)
+        # 按钮字体保持不变，其他组件字体随大小变化；暂停时的加粗样式由 toggle_reminder_pause 负责
+        self.body_font.configure(size=size)
+        self.result_font.configure(size=size)
+        self.reminder_font.configure(size=size + 2 if size > 12 else size)
 
 
 if __name__ == "__main__":
+    # 设置了 LIFE_WEEKS_PROFILE 时才替换热点方法，见 instrument.py
+    profiler = Profiler.from_env()
+    if profiler:
+        profiler.instrument(LifeWeeksApp, APP_METHODS)
+        profiler.instrument(AnimationManager, ANIMATION_METHODS)
     root = tk.Tk()
     app = LifeWeeksApp(root)
+    if profiler:
+        # 画布在启动后的空闲时间才创建
+        app.startup.defer(lambda: profiler.attach(root, app.canvas, app.frame_clock))
     root.mainloop()
 
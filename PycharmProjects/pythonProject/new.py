@@ -1,150 +1,47 @@
 import tkinter as tk
 from datetime import datetime
-import random
 
-class AnimationManager:
-    def __init__(self, canvas):
-        self.canvas = canvas
-        self.animation_running = False
-        self.current_animation_id = None
-        self.current_step = 0
-        self.current_intensity = 0
-        self.color_transition_steps = self.smooth_color_transition("#FFFFFF", "#008000", 10)  # 减少渐变步骤，加快速度
+from catalog import get_catalog
+from core import TOTAL_WEEKS, calculate_weeks_lived
+from dates import parse_date
+from frame_clock import FrameClock
+from instrument import ANIMATION_METHODS, APP_METHODS, Profiler
+from reminders import ShuffleBag
+from startup import Startup
+from week_grid import AnimationManager, CanvasResizeMixin, WeekDetailsMixin, WeekGrid, renderer_from_env
 
-    def start_animation(self):
-        if self.animation_running:
-            return
-        self.animation_running = True
-        self.current_step = 0
-        self.current_intensity = 0
-        self._animate_initial_canvas()
-
-    def stop_animation(self):
-        self.animation_running = False
-        if self.current_animation_id:
-            self.canvas.after_cancel(self.current_animation_id)
-        self.canvas.delete("all")
-
-    def _animate_initial_canvas(self):
-        self.canvas.delete("all")
-        margin = 20
-        inner_width = self.canvas.winfo_width() - 2 * margin
-        inner_height = self.canvas.winfo_height() - 2 * margin
-
-        if inner_width <= 0 or inner_height <= 0:
-            return
-
-        cols = 23
-        rows = 1
-        cell_size_width = inner_width / cols
-        cell_size_height = inner_height / rows
-        cell_size = min(cell_size_width, cell_size_height)
-
-        new_margin_horizontal = (inner_width - (cols * cell_size)) / 2 + margin
-        new_margin_vertical = (inner_height - (rows * cell_size)) / 2 + margin
-
-        # 先绘制所有格子为白色
-        for row in range(rows):
-            for col in range(cols):
-                x1 = new_margin_horizontal + col * cell_size
-                y1 = new_margin_vertical + row * cell_size
-                x2 = x1 + cell_size
-                y2 = y1 + cell_size
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="black")
-
-        # 启动颜色渐变动画
-        self._fill_cells(new_margin_horizontal, new_margin_vertical, cell_size, rows, cols)
-
-    def _fill_cells(self, margin_x, margin_y, cell_size, rows, cols):
-        if not self.animation_running:
-            return
-
-        if self.current_step >= rows * cols:
-            self.restart_animation()  # 确保动画自动重启
-            return
-
-        row = self.current_step // cols
-        col = self.current_step % cols
-        x1 = margin_x + col * cell_size
-        y1 = margin_y + row * cell_size
-        x2 = x1 + cell_size
-        y2 = y1 + cell_size
-
-        # 使用颜色渐变效果
-        if self.current_intensity < len(self.color_transition_steps):
-            color = self.color_transition_steps[self.current_intensity]
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
-            self.current_intensity += 1
-            self.current_animation_id = self.canvas.after(30, self._fill_cells, margin_x, margin_y, cell_size, rows, cols)  # 加快渐变速度
-        else:
-            self.current_step += 1
-            self.current_intensity = 0
-            self.current_animation_id = self.canvas.after(30, self._fill_cells, margin_x, margin_y, cell_size, rows, cols)
-
-    def restart_animation(self):
-        self.current_step = 0
-        self.current_intensity = 0
-        self.animation_running = True
-        self._animate_initial_canvas()  # 确保动画能够不断循环
-
-    def smooth_color_transition(self, start_color, end_color, step_count):
-        # 从开始颜色平滑过渡到结束颜色的函数，使用线性插值
-        start_r, start_g, start_b = tuple(int(start_color[i:i+2], 16) for i in (1, 3, 5))
-        end_r, end_g, end_b = tuple(int(end_color[i:i+2], 16) for i in (1, 3, 5))
-        color_steps = []
-        for step in range(step_count + 1):
-            r = int(start_r + (end_r - start_r) * (step / step_count))
-            g = int(start_g + (end_g - start_g) * (step / step_count))
-            b = int(start_b + (end_b - start_b) * (step / step_count))
-            color_steps.append(f"#{r:02x}{g:02x}{b:02x}")
-        return color_steps
-
-class LifeWeeksApp:
-    # 在创建 LifeWeeksApp 类时，定义一组提醒语句
-    reminder_messages = [
-        "人生短暂，不要让拖延成为你的常态。",
-        "每一周都是宝贵的，不要浪费时间拖延！",
-        "现在的每一个决定，决定了未来的你。",
-        "你可以选择拖延，也可以选择现在行动，做出改变。",
-        "今天做的事，决定你明天的自由。",
-        "未来属于那些今天行动的人，别让拖延阻挡你。",
-        "每一周你都会老去一岁，拖延只能让时间流逝得更快。",
-        "你有多少个88年的周可以浪费？不要再拖延了！",
-        "时间不会等待，抓住现在才能把握未来。",
-        "别再拖延了，否则这些小格子只能越来越少了！",
-        "时间在走，人生的进度条不会等你，赶快行动吧！",
-        "如果你总是拖延，连这些格子都等不及了！",
-        "今天的行动会改变你的明天，不要让拖延成为你前进的障碍。",
-        "每周一个小进步，累积起来就是巨大的成就，别拖延哦！",
-        "时间很快就溜走，珍惜每一周，让自己变得更好。"
-    ]
+class LifeWeeksApp(CanvasResizeMixin, WeekDetailsMixin):
+    # 只有中文界面，提醒语句来自翻译目录
+    texts = get_catalog("zh")
 
     def __init__(self, root):
         self.root = root
-        self.root.title("人生周数提醒器")
+        self.root.title(self.texts["title"])
         self.root.geometry("900x700")
         self.root.resizable(True, True)
 
         # 在类初始化时，随机选择一个提醒语句
-        self.current_reminder = random.choice(self.reminder_messages)
+        self.reminder_bag = ShuffleBag(self.texts.reminders)
+        self.current_reminder = self.reminder_bag.draw()
         self.reminder_paused = False
 
         # 定义初始状态
         self.user_birth_date = None
         self.weeks_lived = 0
-        self.total_weeks = 88 * 52
-        self.resize_in_progress = False
+        self.total_weeks = TOTAL_WEEKS
+        self.pinned_week = None
+        self.shown_week = None
 
-        # 创建 UI 组件
+        # 先创建输入框和按钮，窗口画出来后再在空闲时创建画布和其余组件
+        self.startup = Startup.from_env(self.root)
         self.create_widgets()
-        self.animation_manager = AnimationManager(self.canvas)
-
-        # 延迟启动首页动画
-        self.root.after(100, self.animation_manager.start_animation)
+        self.startup.defer(self.create_canvas)
+        self.startup.start(self.birth_entry)
+        self.birth_entry.focus_set()
 
     def create_widgets(self):
         # 出生日期输入框
-        birth_label = tk.Label(self.root, text="请输入你的出生日期 (YYYY-MM-DD):", font=("微软雅黑", 12))
+        birth_label = tk.Label(self.root, text=self.texts["birth_label"], font=("微软雅黑", 12))
         birth_label.pack(pady=5)
         self.birth_entry = tk.Entry(self.root, font=("微软雅黑", 12))
         self.birth_entry.pack(pady=5)
@@ -153,12 +50,13 @@ class LifeWeeksApp:
         button_frame = tk.Frame(self.root)
         button_frame.place(relx=0.95, rely=0.05, anchor="ne")
 
-        submit_button = tk.Button(button_frame, text="提交", command=self.on_submit_click, font=("微软雅黑", 12))
+        submit_button = tk.Button(button_frame, text=self.texts["submit_button"], command=self.on_submit_click, font=("微软雅黑", 12))
         submit_button.pack(side="left", padx=5)
 
-        home_button = tk.Button(button_frame, text="首页", command=self.back_to_home, font=("微软雅黑", 12))
+        home_button = tk.Button(button_frame, text=self.texts["home_button"], command=self.back_to_home, font=("微软雅黑", 12))
         home_button.pack(side="left", padx=5)
 
+    def create_canvas(self):
         # 提醒信息标签，位置调整到出生日期输入下方
         self.reminder_label = tk.Label(self.root, text=self.current_reminder, font=("微软雅黑", 14, "italic"), fg="blue")
         self.reminder_label.pack(pady=(10, 20))
@@ -170,87 +68,62 @@ class LifeWeeksApp:
         self.canvas = tk.Canvas(canvas_frame, bg="white")
         self.canvas.pack(side="left", fill="both", expand=True)
         self.canvas.bind("<Configure>", self.on_resize)
+        self.bind_week_events()
 
         # 结果标签
         self.result_label = tk.Label(self.root, text="", font=("微软雅黑", 12))
         self.result_label.pack(pady=5)
 
-    def calculate_weeks_lived(self, birth_date, current_date):
-        delta = current_date - birth_date
-        return delta.days // 7
+        # 鼠标所在周的日期范围和年龄
+        self.week_label = tk.Label(self.root, text="", font=("微软雅黑", 12), fg="gray")
+        self.week_label.pack(pady=(0, 5))
+
+        # 渲染方式默认为 auto，可以用 LIFE_WEEKS_RENDERER 指定，见 week_grid.py
+        self.week_grid = WeekGrid(self.canvas, renderer=renderer_from_env())
+        self.frame_clock = FrameClock(self.root)
+        # 首页动画在画布第一次有实际尺寸时开始，见 on_resize
+        self.animation_manager = AnimationManager(self.canvas, self.frame_clock)
 
     def on_submit_click(self):
+        self.startup.finish()
         # 每次点击提交按钮时切换提醒语句（如果未暂停）
         if not self.reminder_paused:
-            self.current_reminder = random.choice(self.reminder_messages)
+            self.current_reminder = self.reminder_bag.draw()
             self.reminder_label.config(text=self.current_reminder)
 
         # 继续处理提交逻辑
         birth_date_str = self.birth_entry.get()
         try:
-            self.user_birth_date = datetime.strptime(birth_date_str, "%Y-%m-%d")
+            self.user_birth_date = parse_date(birth_date_str)
         except ValueError:
-            self.result_label.config(text="请输入有效的出生日期 (格式: YYYY-MM-DD)")
+            self.result_label.config(text=self.texts["invalid_date"])
             return
 
         self.animation_manager.stop_animation()
+        self.reset_week_details()
         current_date = datetime.now()
-        self.weeks_lived = self.calculate_weeks_lived(self.user_birth_date, current_date)
+        self.weeks_lived = calculate_weeks_lived(self.user_birth_date, current_date)
         self.update_canvas(self.weeks_lived, self.total_weeks)
-        self.result_label.config(text=f"你已经度过了 {self.weeks_lived} 周，剩余大约 {self.total_weeks - self.weeks_lived} 周。")
+        self.result_label.config(text=self.texts["result_text"].format(
+            weeks_lived=self.weeks_lived, weeks_remaining=self.total_weeks - self.weeks_lived))
 
     def update_canvas(self, weeks_lived, total_weeks):
-        self.canvas.delete("all")
-        margin = 20
-        inner_width = self.canvas.winfo_width() - 2 * margin
-        inner_height = self.canvas.winfo_height() - 2 * margin
-
-        if inner_width <= 0 or inner_height <= 0:
-            return
-
-        aspect_ratio = inner_width / inner_height
-        total_cells = total_weeks
-
-        best_rows, best_cols = 1, total_cells
-        min_empty_space = float('inf')
-
-        for rows in range(1, total_cells + 1):
-            cols = (total_cells + rows - 1) // rows
-            calculated_aspect_ratio = cols / rows
-            empty_space = abs(calculated_aspect_ratio - aspect_ratio)
-
-            if empty_space < min_empty_space:
-                min_empty_space = empty_space
-                best_rows, best_cols = rows, cols
-
-        rows, cols = best_rows, best_cols
-        cell_size_width = inner_width / cols
-        cell_size_height = inner_height / rows
-        cell_size = min(cell_size_width, cell_size_height)
-
-        new_margin_horizontal = (inner_width - (cols * cell_size)) / 2 + margin
-        new_margin_vertical = (inner_height - (rows * cell_size)) / 2 + margin
-
-        for row in range(rows):
-            for col in range(cols):
-                week_index = row * cols + col
-                if week_index >= total_weeks:
-                    break
-                x1 = new_margin_horizontal + col * cell_size
-                y1 = new_margin_vertical + row * cell_size
-                x2 = x1 + cell_size
-                y2 = y1 + cell_size
-                color = "#008000" if week_index < weeks_lived else "white"
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
+        self.week_grid.draw(weeks_lived, total_weeks)
 
     def back_to_home(self):
+        self.startup.finish()
         self.animation_manager.stop_animation()
+        self.reset_week_details()
+        self.week_grid.clear()
         self.result_label.config(text="")
         if not self.reminder_paused:
-            self.current_reminder = random.choice(self.reminder_messages)
+            self.current_reminder = self.reminder_bag.draw()
             self.reminder_label.config(text=self.current_reminder)
         self.animation_manager.start_animation()
 
+    def week_detail_template(self):
+        return self.texts["week_detail"]
+
     def toggle_reminder_pause(self, event):
         # 点击提醒标签时暂停或恢复切换
         self.reminder_paused = not self.reminder_paused
@@ -259,22 +132,15 @@ class LifeWeeksApp:
         else:
             self.reminder_label.config(font=("微软雅黑", 14, "italic"), fg="blue")  # 恢复正常状态
 
-    def on_resize(self, event):
-        if self.resize_in_progress:
-            return
-        self.resize_in_progress = True
-
-        def complete_resize():
-            self.resize_in_progress = False
-            if self.animation_manager.animation_running:
-                self.animation_manager.stop_animation()
-                self.animation_manager.start_animation()
-            elif self.user_birth_date:
-                self.update_canvas(self.weeks_lived, self.total_weeks)
-
-        self.canvas.after(100, complete_resize)
-
 if __name__ == "__main__":
+    # 设置了 LIFE_WEEKS_PROFILE 时才替换热点方法，见 instrument.py
+    profiler = Profiler.from_env()
+    if profiler:
+        profiler.instrument(LifeWeeksApp, APP_METHODS)
+        profiler.instrument(AnimationManager, ANIMATION_METHODS)
     root = tk.Tk()
     app = LifeWeeksApp(root)
+    if profiler:
+        # 画布在启动后的空闲时间才创建
+        app.startup.defer(lambda: profiler.attach(root, app.canvas, app.frame_clock))
     root.mainloop()
@@ -0,0 +1,72 @@
+import numpy as np
+
+from core.layout import block_rects, range_rects
+
+# Tk 里常用的几个颜色名，其余颜色使用 #rrggbb
+NAMED_COLORS = {
+    "white": (255, 255, 255),
+    "black": (0, 0, 0),
+    "green": (0, 128, 0),
+    "red": (255, 0, 0),
+    "blue": (0, 0, 255),
+}
+
+
+def to_rgb(color):
+    """颜色名或 #rrggbb 转成 (r, g, b)；已经是元组时原样返回。Tk 里的其他写法由调用方先用 winfo_rgb 解析。"""
+    if isinstance(color, tuple):
+        return color
+    if color in NAMED_COLORS:
+        return NAMED_COLORS[color]
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def _px(value):
+    return int(round(value))
+
+
+def _fill_block(pixels, layout, cell_count, rgb):
+    for x1, y1, x2, y2 in block_rects(layout, cell_count):
+        pixels[_px(y1):_px(y2), _px(x1):_px(x2)] = rgb
+
+
+def render_grid(layout, weeks_lived, width, height, lived_color="#008000", empty_color="white",
+                outline="black", background="white", lived_runs=None):
+    """把格子画进一个 (height, width, 3) 的 uint8 数组。
+
+    lived_runs 为 (起始格, 结束格, 颜色) 的序列时按段给已度过的格子着色，否则统一使用 lived_color。
+    """
+    pixels = np.empty((height, width, 3), dtype=np.uint8)
+    pixels[:] = to_rgb(background)
+    if layout is None:
+        return pixels
+
+    _fill_block(pixels, layout, layout.total_cells, to_rgb(empty_color))
+    if lived_runs is None:
+        _fill_block(pixels, layout, weeks_lived, to_rgb(lived_color))
+    else:
+        for start, end, color in lived_runs:
+            for x1, y1, x2, y2 in range_rects(layout, start, end):
+                pixels[_px(y1):_px(y2), _px(x1):_px(x2)] = to_rgb(color)
+
+    x0, y0, cell_size, cols = layout.x0, layout.y0, layout.cell_size, layout.cols
+    full_rows, last_cols = divmod(layout.total_cells, cols)
+    line_rgb = to_rgb(outline)
+
+    # 网格线的像素坐标，越界的线裁到图像内
+    xs = np.clip(np.rint(x0 + np.arange(cols + 1) * cell_size).astype(int), 0, width - 1)
+    ys = np.clip(np.rint(y0 + np.arange(full_rows + 2) * cell_size).astype(int), 0, height - 1)
+    full_bottom = ys[full_rows]
+    last_bottom = ys[full_rows + 1] if last_cols else full_bottom
+
+    pixels[ys[:full_rows + 1], xs[0]:xs[-1] + 1] = line_rgb
+    pixels[ys[0]:full_bottom + 1, xs] = line_rgb
+    if last_cols:
+        pixels[last_bottom, xs[0]:xs[last_cols] + 1] = line_rgb
+        pixels[full_bottom:last_bottom + 1, xs[:last_cols + 1]] = line_rgb
+    return pixels
+
+
+def to_ppm(pixels):
+    height, width = pixels.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + pixels.tobytes()
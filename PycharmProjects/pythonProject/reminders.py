@@ -0,0 +1,66 @@
+"""不重复地抽取激励短语。
+
+ShuffleBag 把短语洗牌后逐个取出，一轮取完才重新洗牌，每次抽取 O(1)；
+ReminderSampler 为每种语言各保留一个袋子，可以在 Flask 的多个线程间共用：
+
+    sampler = ReminderSampler(seed=0)
+    sampler.draw("English")
+"""
+import random
+import threading
+
+from catalog import get_catalog, normalize_language
+
+
+class ShuffleBag:
+    def __init__(self, items, seed=None, rng=None):
+        self.items = tuple(items)
+        if not self.items:
+            raise ValueError("ShuffleBag needs at least one item")
+        self._rng = rng or random.Random(seed)
+        self._lock = threading.Lock()
+        self._bag = []
+        self._last = None
+
+    def __len__(self):
+        return len(self.items)
+
+    def remaining(self):
+        return len(self._bag)
+
+    def draw(self):
+        with self._lock:
+            if not self._bag:
+                self._refill()
+            self._last = self._bag.pop()
+            return self._last
+
+    def _refill(self):
+        bag = list(self.items)
+        self._rng.shuffle(bag)
+        # 新一轮的第一个不能和上一轮的最后一个相同；pop 从末尾取，所以检查 bag[-1]
+        if len(bag) > 1 and bag[-1] == self._last:
+            bag[0], bag[-1] = bag[-1], bag[0]
+        self._bag = bag
+
+
+class ReminderSampler:
+    def __init__(self, seed=None):
+        self._rng = random.Random(seed)
+        self._bags = {}
+        self._lock = threading.Lock()
+
+    def bag(self, language):
+        code = normalize_language(language)
+        bag = self._bags.get(code)
+        if bag is None:
+            with self._lock:
+                bag = self._bags.get(code)
+                if bag is None:
+                    # 每个袋子有自己的随机数生成器，种子由 sampler 的种子决定，测试时结果可复现
+                    rng = random.Random(self._rng.random())
+                    bag = self._bags[code] = ShuffleBag(get_catalog(code).reminders, rng=rng)
+        return bag
+
+    def draw(self, language):
+        return self.bag(language).draw()
@@ -0,0 +1,90 @@
+"""用 gevent 运行 app.py 的生产模式服务器。
+
+本地启动（默认 127.0.0.1:8000，单进程，每个进程最多 1000 个并发连接）：
+
+    python serve.py
+    python serve.py --host 0.0.0.0 --port 8000 --workers 4 --pool-size 2000
+
+--workers 大于 1 时预先 fork 多个进程共享同一个监听端口，仅在支持 fork 的系统上可用。
+开发调试仍然可以直接运行 python app.py。
+"""
+from gevent import monkey
+
+monkey.patch_all()
+
+import argparse
+import os
+import signal
+import socket
+import sys
+
+from gevent.pool import Pool
+from gevent.pywsgi import WSGIServer
+
+from app import app
+
+DEFAULT_POOL_SIZE = 1000
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the life weeks web app with gevent.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE,
+                        help="max concurrent connections (greenlets) per worker")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--access-log", action="store_true", help="log every request to stderr")
+    return parser.parse_args(argv)
+
+
+def create_listener(host, port, backlog):
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen(backlog)
+    return listener
+
+
+def serve_forever(listener, pool_size, access_log):
+    server = WSGIServer(listener, app, spawn=Pool(pool_size), log="default" if access_log else None)
+    server.serve_forever()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    listener = create_listener(args.host, args.port, args.backlog)
+
+    workers = args.workers
+    if workers > 1 and not hasattr(os, "fork"):
+        print("--workers > 1 needs os.fork, falling back to a single worker", file=sys.stderr)
+        workers = 1
+
+    print(f"Serving on http://{args.host}:{args.port} "
+          f"({workers} worker(s), pool size {args.pool_size})", file=sys.stderr)
+
+    if workers == 1:
+        serve_forever(listener, args.pool_size, args.access_log)
+        return
+
+    # 预先 fork：子进程共享监听端口，父进程只负责等待和转发退出信号
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            serve_forever(listener, args.pool_size, args.access_log)
+            os._exit(0)
+        children.append(pid)
+
+    def stop(signum, frame):
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for pid in children:
+        os.waitpid(pid, 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""桌面程序的冷启动：先把窗口和输入框画出来，其余组件放到空闲时逐个创建。
+
+    startup = Startup.from_env(root)
+    startup.defer(self.create_canvas)        # 推迟的任务按加入顺序执行
+    startup.start(self.birth_entry)          # birth_entry 第一次绘制后开始执行
+    startup.finish()                         # 事件处理函数需要完整界面时，立即执行剩下的任务
+
+marks 记录几个时刻距创建 Startup 的毫秒数：first_paint（输入框第一次绘制）、interactive（推迟的任务全部完成）、
+animation（画布有了实际尺寸，首页动画开始）。设置环境变量 LIFE_WEEKS_STARTUP 为文件路径时，
+三个时刻都记下后把结果写入 JSON 并关闭窗口，供 benchmarks/bench_startup.py 统计：
+
+    LIFE_WEEKS_STARTUP=startup.json python ASCII.py
+"""
+import json
+import os
+import time
+from collections import deque
+
+STARTUP_ENV = "LIFE_WEEKS_STARTUP"
+# 收不到 Expose 事件时（例如窗口以最小化状态启动），最多等这么久就开始执行推迟的任务
+FIRST_PAINT_FALLBACK_MS = 500
+BENCHMARK_MARKS = ("first_paint", "interactive", "animation")
+
+
+class Startup:
+    def __init__(self, root, output=None, exit_marks=()):
+        self.root = root
+        self.output = output
+        self.exit_marks = exit_marks
+        self.started = time.perf_counter()
+        self.created = time.time()
+        self.marks = {}
+        self.epoch = {}
+        self.finished = False
+        self._tasks = deque()
+        self._painted = False
+
+    @classmethod
+    def from_env(cls, root, environ=os.environ):
+        """设置了 LIFE_WEEKS_STARTUP 时进入测量模式：记下全部时刻后写出 JSON 并退出。"""
+        output = environ.get(STARTUP_ENV) or None
+        return cls(root, output=output, exit_marks=BENCHMARK_MARKS if output else ())
+
+    def defer(self, func, *args):
+        # 推迟的任务已经执行完时直接执行，调用方不用关心启动进行到哪一步
+        if self.finished:
+            func(*args)
+        else:
+            self._tasks.append((func, args))
+
+    def start(self, widget):
+        widget.bind("<Expose>", self._on_expose, add="+")
+        self.root.after(FIRST_PAINT_FALLBACK_MS, self._first_paint)
+
+    def finish(self):
+        while self._tasks:
+            func, args = self._tasks.popleft()
+            func(*args)
+        if not self.finished:
+            self.finished = True
+            self.mark("interactive")
+
+    def mark(self, name):
+        if name in self.marks:
+            return
+        self.marks[name] = round((time.perf_counter() - self.started) * 1000, 3)
+        self.epoch[name] = time.time()
+        if self.exit_marks and all(mark in self.marks for mark in self.exit_marks):
+            self.dump(self.output)
+            self.root.after_idle(self.root.destroy)
+
+    def report(self):
+        return {"created": self.created, "marks_ms": self.marks, "epoch": self.epoch}
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def _on_expose(self, event):
+        self._first_paint()
+
+    def _first_paint(self):
+        # Expose 绑定会一直留着，只有第一次起作用
+        if self._painted:
+            return
+        self._painted = True
+        self.mark("first_paint")
+        # 空闲回调排在这次重绘之后，窗口先显示出来
+        self.root.after_idle(self._run_next)
+
+    def _run_next(self):
+        if self.finished:
+            return
+        if self._tasks:
+            func, args = self._tasks.popleft()
+            func(*args)
+        if self._tasks:
+            # 每个任务之间回到事件循环，输入框照常响应按键
+            self.root.after_idle(self._run_next)
+        else:
+            self.finish()
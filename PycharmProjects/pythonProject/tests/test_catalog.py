@@ -0,0 +1,20 @@
+import json
+
+import catalog
+from catalog import Catalog, available_languages, normalize_language
+
+
+def test_shipped_languages_and_legacy_names():
+    assert {"zh", "en"} <= available_languages()
+    assert [normalize_language(name) for name in ("zh", "cn", "Chinese", "中文")] == ["zh"] * 4
+    assert [normalize_language(name) for name in ("en", "English")] == ["en"] * 2
+    assert normalize_language(None) == "zh"
+    assert normalize_language("../en", default="en") == "en"
+
+
+def test_new_locale_file_is_reachable_by_its_code(tmp_path, monkeypatch):
+    (tmp_path / "fr.json").write_text(json.dumps({"title": "Rappel", "reminders": ["Allez !"]}), encoding="utf-8")
+    assert available_languages(str(tmp_path)) == {"fr"}
+    monkeypatch.setattr(catalog, "available_languages", lambda: available_languages(str(tmp_path)))
+    assert normalize_language("fr") == "fr"
+    assert Catalog.load("fr", str(tmp_path)).reminders == ("Allez !",)
@@ -0,0 +1,67 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from dates import INVALID_DATE, ISO_DATE_FORMAT, _parse, parse_date, parse_dates
+
+# 各种写法的数字：ASCII、阿拉伯-印度数字、全角数字、上标（不是十进制数字）
+DIGITS = ("0123456789", "٠١٢٣٤٥٦٧٨٩", "０１２３４５６７８９", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+EDGE_CASES = [
+    "2000-01-01", "2000-02-29", "1900-02-29", "2000-1-1", "2000-01- 1", "2000-01-01 ", " 2000-01-01",
+    "2000-001-01", "0000-01-01", "0001-01-01", "9999-12-31", "2000-13-01", "2000-00-10", "2000/01/01",
+    "", "-", "--", "2000--01", "٢٠٠٠-٠١-٠١", "٢٠٠٠-01-01", "２０００-01-01", "2000-０１-01", "2000-01-٠١",
+]
+
+
+def strptime_or_none(text):
+    try:
+        return datetime.strptime(text, ISO_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def random_date_text(rng):
+    digits = rng.choice(DIGITS)
+    parts = []
+    for width in (4, rng.choice((1, 2, 3)), rng.choice((1, 2))):
+        parts.append("".join(rng.choice(digits if rng.random() < 0.9 else DIGITS[0]) for _ in range(width)))
+    text = "-".join(parts)
+    if rng.random() < 0.1:
+        index = rng.randrange(len(text) + 1)
+        text = text[:index] + rng.choice(" -/x") + text[index:]
+    return text
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_parse_date_matches_strptime_on_edge_cases(text):
+    expected = strptime_or_none(text)
+    if expected is None:
+        with pytest.raises(ValueError):
+            parse_date(text)
+    else:
+        assert parse_date(text) == expected
+
+
+def test_parse_dates_matches_strptime_on_random_inputs():
+    rng = random.Random(0)
+    texts = [random_date_text(rng) for _ in range(20000)]
+    dates, errors = parse_dates(texts)
+    for index, (text, parsed) in enumerate(zip(texts, dates)):
+        assert parsed == strptime_or_none(text), text
+        assert (index in errors) == (parsed is None)
+
+
+def test_parse_dates_rejects_non_strings():
+    dates, errors = parse_dates([None, 20000101, "2000-01-01"])
+    assert dates[:2] == [None, None]
+    assert sorted(errors) == [0, 1]
+
+
+def test_long_inputs_are_not_cached():
+    long_text = "2000-01-01" + "x" * 100000
+    before = _parse.cache_info().currsize
+    with pytest.raises(ValueError):
+        parse_date(long_text)
+    assert parse_dates([long_text, "2000-01-01 "]) == ([None, None], {0: INVALID_DATE, 1: INVALID_DATE})
+    assert _parse.cache_info().currsize == before
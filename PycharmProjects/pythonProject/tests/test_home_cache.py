@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("flask")
+
+from app import app, result_cache
+
+
+def test_language_spellings_share_one_cache_entry():
+    client = app.test_client()
+    result_cache.clear()
+    for language in ("en", "English"):
+        assert client.post("/", data={"birth_date": "2000-01-01", "language": language}).status_code == 200
+    for language in ("中文", "zh", "x" * 5000, None):
+        data = {"birth_date": "2000-01-01"}
+        if language:
+            data["language"] = language
+        assert client.post("/", data=data).status_code == 200
+    assert result_cache.stats()["size"] == 2
+
+
+def test_long_birth_dates_are_not_cached():
+    client = app.test_client()
+    result_cache.clear()
+    assert client.post("/", data={"birth_date": "2000-01-01" * 1000, "language": "en"}).status_code == 200
+    assert result_cache.stats()["size"] == 0
@@ -0,0 +1,5 @@
+from benchmarks import bench_import
+
+
+def test_core_import_within_budget_and_without_tkinter(capsys):
+    assert bench_import.main(["--modules", "core"]) == 0, capsys.readouterr().out
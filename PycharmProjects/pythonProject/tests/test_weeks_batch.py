@@ -0,0 +1,46 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("numpy")
+
+from app import app, calculate_weeks_batch
+from core import TOTAL_WEEKS
+from dates import parse_dates
+
+TODAY = date(2024, 6, 1)
+BATCHES = [
+    ["2000-01-01", "1990-12-31"],
+    ["0000-01-01", "2000-01-01"],
+    ["0000-01-01", "bad"],
+    ["2000-02-30", "2000-02-29"],
+    [None, 20000101, "2000-01-01"],
+    [["a"], ["b", "c"], "2000-01-01"],
+    [{"a": 1}, "١٩٩٠-01-01"],
+]
+
+
+def expected_batch(texts):
+    dates, errors = parse_dates(texts)
+    lived = [None if d is None else (TODAY - d.date()).days // 7 for d in dates]
+    return lived, sorted(errors)
+
+
+@pytest.mark.parametrize("texts", BATCHES)
+def test_batch_matches_parse_dates_item_by_item(texts):
+    result = calculate_weeks_batch(texts, today=TODAY)
+    lived, errors = expected_batch(texts)
+    assert result["weeks_lived"] == lived
+    assert result["weeks_remaining"] == [None if w is None else TOTAL_WEEKS - w for w in lived]
+    assert sorted(int(index) for index in result["errors"]) == errors
+
+
+def test_batch_endpoint_accepts_ragged_lists():
+    response = app.test_client().post("/api/weeks", json={"birth_dates": [["a"], ["b", "c"]]})
+    assert response.status_code == 200
+    assert response.get_json()["weeks_lived"] == [None, None]
+
+
+def test_batch_endpoint_rejects_non_object_body():
+    assert app.test_client().post("/api/weeks", json=["2000-01-01"]).status_code == 400
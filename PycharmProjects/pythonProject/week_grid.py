@@ -0,0 +1,634 @@
+import os
+import time
+import tkinter as tk
+
+from core.colors import (COLOR_MODES, EMPTY_COLOR, LIVED_COLOR, OUTLINE_COLOR, lived_bands, lived_cell_colors,
+                         lived_runs, palette)
+from core.layout import (DETAIL_LEVELS, MIN_CELL_PIXELS, block_rects, cell_at, cell_rect, choose_detail,
+                         clip_to_view, compute_layout, grid_lines, range_rects, zoom_layout)
+from dates import age_on, week_span
+from frame_clock import FrameClock
+
+HIGHLIGHT_COLOR = "#FF8C00"
+
+# 窗口缩放防抖间隔的上下限（毫秒）
+MIN_RESIZE_DELAY = 16
+MAX_RESIZE_DELAY = 250
+
+# 鼠标滚轮每一格的缩放倍数，以及放大后格子边长的上限（像素）
+ZOOM_STEP = 1.25
+MAX_ZOOM_CELL_PIXELS = 80
+
+
+def resize_delay_for(redraw_ms):
+    """根据上一次重绘耗时给出下一次缩放的防抖间隔。"""
+    return int(min(MAX_RESIZE_DELAY, max(MIN_RESIZE_DELAY, redraw_ms * 2)))
+
+
+class CellRenderer:
+    """每周一个矩形，图元数与周数成正比。"""
+
+    scalable = True
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.items = []
+
+    def build(self, layout, weeks_lived):
+        grid = self.grid
+        create_rectangle = grid.canvas.create_rectangle
+        cols, cell_size = layout.cols, layout.cell_size
+        lived_colors = grid.lived_cell_colors()
+
+        items = []
+        for week_index in range(layout.total_cells):
+            row, col = divmod(week_index, cols)
+            x1 = layout.x0 + col * cell_size
+            y1 = layout.y0 + row * cell_size
+            color = lived_colors[week_index] if week_index < weeks_lived else grid.empty_color
+            items.append(create_rectangle(x1, y1, x1 + cell_size, y1 + cell_size,
+                                          fill=color, outline=grid.outline, tags=grid.tag))
+        self.items = items
+
+    def recolor(self, layout, old_weeks_lived, weeks_lived):
+        # 只有新旧分界之间的格子状态发生了变化
+        grid = self.grid
+        low, high = sorted((old_weeks_lived, weeks_lived))
+        itemconfig = grid.canvas.itemconfig
+        if weeks_lived > old_weeks_lived:
+            lived_colors = grid.lived_cell_colors()
+            for index in range(low, high):
+                itemconfig(self.items[index], fill=lived_colors[index])
+        else:
+            for item in self.items[low:high]:
+                itemconfig(item, fill=grid.empty_color)
+
+    def clear(self):
+        self.items = []
+
+
+class SpanRenderer:
+    """按行合并填充区域，再用少量直线画出网格，图元数与行数成正比。"""
+
+    scalable = True
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.lived_tag = grid.tag + "_lived"
+        self.lines_tag = grid.tag + "_lines"
+
+    def build(self, layout, weeks_lived):
+        grid = self.grid
+        canvas = grid.canvas
+
+        # 未度过区域的底色
+        self._create_block(layout, layout.total_cells, grid.empty_color, grid.tag)
+        self._create_lived(layout, weeks_lived)
+
+        tags = (grid.tag, self.lines_tag)
+        for line in grid_lines(layout):
+            canvas.create_line(*line, fill=grid.outline, tags=tags)
+
+    def recolor(self, layout, old_weeks_lived, weeks_lived):
+        # 已度过区域每个颜色段最多三个矩形，直接重画再压到网格线下面
+        canvas = self.grid.canvas
+        canvas.delete(self.lived_tag)
+        if self._create_lived(layout, weeks_lived):
+            canvas.tag_lower(self.lived_tag, self.lines_tag)
+
+    def clear(self):
+        pass
+
+    def _create_block(self, layout, cell_count, color, tags):
+        rects = block_rects(layout, cell_count)
+        for rect in rects:
+            self.grid.canvas.create_rectangle(*rect, fill=color, outline="", tags=tags)
+        return bool(rects)
+
+    def _create_lived(self, layout, weeks_lived):
+        tags = (self.grid.tag, self.lived_tag)
+        created = False
+        for start, end, color in self.grid.lived_runs(weeks_lived):
+            for rect in range_rects(layout, start, end):
+                self.grid.canvas.create_rectangle(*rect, fill=color, outline="", tags=tags)
+                created = True
+        return created
+
+
+class RasterRenderer:
+    """用 NumPy 把整个格子画成像素，再作为一张 PhotoImage 放到画布上，图元数恒为 1。"""
+
+    # 图片不能随 canvas.scale 缩放，尺寸变化时重新生成
+    scalable = False
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.image = None
+        self.item = None
+        self._rgb = {}
+
+    def build(self, layout, weeks_lived):
+        self.item = self.grid.canvas.create_image(0, 0, image=self._render(layout, weeks_lived),
+                                                  anchor="nw", tags=self.grid.tag)
+
+    def recolor(self, layout, old_weeks_lived, weeks_lived):
+        self.grid.canvas.itemconfig(self.item, image=self._render(layout, weeks_lived))
+
+    def clear(self):
+        self.image = None
+        self.item = None
+
+    def _render(self, layout, weeks_lived):
+        # 只有选用该渲染器时才导入 NumPy
+        import raster
+
+        grid = self.grid
+        canvas = grid.canvas
+        rgb = self._to_rgb
+        runs = [(start, end, rgb(color)) for start, end, color in grid.lived_runs(weeks_lived)]
+        pixels = raster.render_grid(layout, weeks_lived, canvas.winfo_width(), canvas.winfo_height(),
+                                    lived_color=rgb(grid.lived_color), empty_color=rgb(grid.empty_color),
+                                    outline=rgb(grid.outline), background=rgb(canvas.cget("background")),
+                                    lived_runs=runs)
+        # 持有引用，防止 PhotoImage 被回收后画布上的图片消失
+        self.image = tk.PhotoImage(master=canvas, data=raster.to_ppm(pixels), format="PPM")
+        return self.image
+
+    def _to_rgb(self, color):
+        # 由 Tk 解析颜色，#fff、SystemButtonFace 等写法都能识别；winfo_rgb 返回 16 位分量
+        rgb = self._rgb.get(color)
+        if rgb is None:
+            rgb = self._rgb[color] = tuple(value >> 8 for value in self.grid.canvas.winfo_rgb(color))
+        return rgb
+
+
+RENDERERS = {
+    "cells": CellRenderer,
+    "spans": SpanRenderer,
+    "raster": RasterRenderer,
+}
+
+# 桌面程序按这个环境变量选择渲染方式，例如 LIFE_WEEKS_RENDERER=raster python main.py
+RENDERER_ENV = "LIFE_WEEKS_RENDERER"
+
+
+def renderer_from_env(environ=os.environ, default="auto"):
+    name = environ.get(RENDERER_ENV, "").strip() or default
+    if name != "auto" and name not in RENDERERS:
+        raise ValueError(f"{RENDERER_ENV} must be one of auto, {', '.join(RENDERERS)}; got {name!r}")
+    return name
+
+
+class WeekGrid:
+    """常驻画布的周数格子：布局不变时只改颜色，不重新创建图元。
+
+    renderer 为 "cells" 时每周一个矩形；"spans" 时按行合并填充区域；
+    "raster" 时整个格子是一张图片；"auto" 每次重建时比较两种方式的图元数，
+    格子很少、合并后的网格线和填充区域反而更多时改用 "cells"，否则用 "spans"。
+
+    窗口太小、每周一格的边长不足 min_cell 像素时，按 detail_levels 改为每格四周或一年；
+    用 zoom_at 放大后总是回到逐周显示，并且只画画布可见范围内的部分。
+
+    week_at 和 highlight 只依赖布局计算，与渲染方式无关：鼠标坐标直接换算成周下标，
+    高亮始终复用同一个矩形图元。
+
+    color_mode 为 core.colors.COLOR_MODES 之一：除单色外，已度过的周可以按年龄分段着色。
+    各段颜色来自按 (模式, 总周数, 每格周数) 缓存的色表，逐格着色时每格只查一次表，
+    合并填充区域时每段最多多出三个矩形。
+    """
+
+    def __init__(self, canvas, tag="grid", lived_color=LIVED_COLOR, empty_color=EMPTY_COLOR,
+                 outline=OUTLINE_COLOR, renderer="auto", highlight_color=HIGHLIGHT_COLOR,
+                 min_cell=MIN_CELL_PIXELS, detail_levels=DETAIL_LEVELS, color_mode="solid"):
+        if color_mode not in COLOR_MODES:
+            raise ValueError(f"unknown color mode {color_mode!r}")
+        self.canvas = canvas
+        self.tag = tag
+        self.lived_color = lived_color
+        self.empty_color = empty_color
+        self.outline = outline
+        self.highlight_color = highlight_color
+        self.min_cell = min_cell
+        self.detail_levels = detail_levels
+        self.color_mode = color_mode
+
+        self.layout = None
+        self.weeks_per_cell = 1
+        self.lived_cells = 0
+        self.weeks_lived = 0
+        self.total_weeks = 0
+        self.base_layout = None
+        self.zoomed = None
+        self.zoom_drawn = False
+        self.highlighted = None
+        self.highlight_item = None
+        self.renderer_name = renderer
+        self.renderer = self._make_renderer(renderer)
+
+    def draw(self, weeks_lived, total_weeks):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        base = compute_layout(width, height, total_weeks)
+        if base is None:
+            return None
+
+        weeks_lived = max(0, min(weeks_lived, total_weeks))
+        if base != self.base_layout:
+            # 画布尺寸或总周数变了，之前的放大位置不再有意义
+            self.zoomed = None
+        self.base_layout = base
+        self.total_weeks = total_weeks
+
+        if self.zoomed is not None:
+            if not (self.zoom_drawn and self.layout == self.zoomed and weeks_lived == self.weeks_lived):
+                self.weeks_lived = weeks_lived
+                self._draw_zoomed(width, height)
+            return self.zoomed
+
+        weeks_per_cell, layout = choose_detail(width, height, total_weeks, self.min_cell, self.detail_levels)
+        lived_cells = -(-weeks_lived // weeks_per_cell)
+        self.weeks_lived = weeks_lived
+        if (self.zoom_drawn or weeks_per_cell != self.weeks_per_cell or not self._same_grid(layout)
+                or (layout != self.layout and not self.renderer.scalable)):
+            self._build(layout, weeks_per_cell, lived_cells)
+        else:
+            if layout != self.layout:
+                self._rescale(layout)
+            if lived_cells != self.lived_cells:
+                self.renderer.recolor(layout, self.lived_cells, lived_cells)
+                self.lived_cells = lived_cells
+        return layout
+
+    def zoom_at(self, x, y, steps):
+        """以画布坐标 (x, y) 为中心缩放，steps 为正时放大；缩回原大小时恢复整体视图。"""
+        base = self.base_layout
+        if base is None or self.layout is None:
+            return None
+
+        current = self.zoomed or base
+        cell_size = current.cell_size * ZOOM_STEP ** steps
+        if steps > 0:
+            # 从聚合视图放大时，一步就放大到逐周格子足够清晰
+            cell_size = min(max(cell_size, self.min_cell), MAX_ZOOM_CELL_PIXELS)
+        if cell_size <= base.cell_size or (steps < 0 and cell_size < self.min_cell):
+            if self.zoomed is None:
+                return None
+            self.zoomed = None
+        elif self.zoomed is None and self.weeks_per_cell > 1 and self.week_at(x, y) is not None:
+            # 聚合视图与逐周布局的行列不同，让鼠标下那一格的第一周落在鼠标位置
+            row, col = divmod(self.week_at(x, y), base.cols)
+            self.zoomed = base._replace(cell_size=cell_size, x0=x - (col + 0.5) * cell_size,
+                                        y0=y - (row + 0.5) * cell_size)
+        else:
+            self.zoomed = zoom_layout(current, x, y, cell_size / current.cell_size)
+        return self.draw(self.weeks_lived, self.total_weeks)
+
+    def week_at(self, x, y):
+        """画布坐标下的周下标（从 0 开始），不在格子上或还没有画格子时返回 None。
+
+        聚合显示时返回鼠标所在格子的第一周。
+        """
+        if self.layout is None:
+            return None
+        cell = cell_at(self.layout, x, y)
+        if cell is None:
+            return None
+        return min(cell * self.weeks_per_cell, self.total_weeks - 1)
+
+    def highlight(self, week_index):
+        """高亮第 week_index 周所在的格子，None 表示取消高亮。"""
+        self.highlighted = week_index
+        canvas = self.canvas
+        if week_index is None or self.layout is None:
+            if self.highlight_item is not None:
+                canvas.itemconfig(self.highlight_item, state="hidden")
+            return
+
+        rect = cell_rect(self.layout, week_index // self.weeks_per_cell)
+        if self.highlight_item is None:
+            # 高亮框也带 grid 标签，随格子一起缩放和删除
+            self.highlight_item = canvas.create_rectangle(*rect, outline=self.highlight_color, width=2,
+                                                          tags=(self.tag, self.tag + "_highlight"))
+        else:
+            canvas.coords(self.highlight_item, *rect)
+            canvas.itemconfig(self.highlight_item, state="normal")
+        canvas.tag_raise(self.highlight_item)
+
+    def set_color_mode(self, color_mode):
+        if color_mode not in COLOR_MODES:
+            raise ValueError(f"unknown color mode {color_mode!r}")
+        self.color_mode = color_mode
+        if self.layout is not None:
+            # 换了配色要重新着色，布局清空后 draw 会按原来的放大位置重建
+            self.layout = None
+            self.draw(self.weeks_lived, self.total_weeks)
+
+    def cycle_color_mode(self):
+        """切换到下一种着色方式，返回新的方式。"""
+        self.set_color_mode(COLOR_MODES[(COLOR_MODES.index(self.color_mode) + 1) % len(COLOR_MODES)])
+        return self.color_mode
+
+    def lived_cell_colors(self):
+        return lived_cell_colors(self.color_mode, self.total_weeks, self.weeks_per_cell, self.lived_color)
+
+    def lived_runs(self, lived_cells):
+        return lived_runs(self.color_mode, self.total_weeks, lived_cells, self.weeks_per_cell, self.lived_color)
+
+    def set_renderer(self, renderer):
+        self.clear()
+        self.renderer_name = renderer
+        self.renderer = self._make_renderer(renderer)
+
+    def clear(self):
+        self.canvas.delete(self.tag)
+        self.renderer.clear()
+        self.layout = None
+        self.weeks_per_cell = 1
+        self.lived_cells = 0
+        self.weeks_lived = 0
+        self.base_layout = None
+        self.zoomed = None
+        self.zoom_drawn = False
+        self.highlighted = None
+        self.highlight_item = None
+
+    def _make_renderer(self, name):
+        if name == "auto":
+            name = "spans"
+        return RENDERERS[name](self)
+
+    def _same_grid(self, layout):
+        old = self.layout
+        return (old is not None and old.rows == layout.rows and old.cols == layout.cols
+                and old.total_cells == layout.total_cells)
+
+    def _build(self, layout, weeks_per_cell, lived_cells):
+        self.canvas.delete(self.tag)
+        self.renderer.clear()
+        # 渲染器按每格周数查色表，要在 build 之前更新
+        self.weeks_per_cell = weeks_per_cell
+        if self.renderer_name == "auto":
+            renderer = CellRenderer if layout.total_cells <= self._span_items(layout) else SpanRenderer
+            if type(self.renderer) is not renderer:
+                self.renderer = renderer(self)
+        self.renderer.build(layout, lived_cells)
+        self._drawn(layout, weeks_per_cell, lived_cells, zoomed=False)
+
+    def _span_items(self, layout):
+        # 合并方式的图元数上限：网格线、未度过区域的底色，以及每个颜色段最多三个矩形
+        bands = lived_bands(self.color_mode, self.total_weeks, self.weeks_per_cell, self.lived_color)
+        return len(grid_lines(layout)) + 2 + 3 * len(bands)
+
+    def _draw_zoomed(self, width, height):
+        # 放大后按逐周显示，只创建与画布相交的填充区域和网格线，图元数与可见的行列数成正比
+        canvas = self.canvas
+        layout = self.zoomed
+        canvas.delete(self.tag)
+        self.renderer.clear()
+        self.weeks_per_cell = 1
+
+        for rect in clip_to_view(block_rects(layout, layout.total_cells), width, height):
+            canvas.create_rectangle(*rect, fill=self.empty_color, outline="", tags=self.tag)
+        for start, end, color in self.lived_runs(self.weeks_lived):
+            for rect in clip_to_view(range_rects(layout, start, end), width, height):
+                canvas.create_rectangle(*rect, fill=color, outline="", tags=self.tag)
+        for line in clip_to_view(grid_lines(layout), width, height):
+            canvas.create_line(*line, fill=self.outline, tags=self.tag)
+        self._drawn(layout, 1, self.weeks_lived, zoomed=True)
+
+    def _drawn(self, layout, weeks_per_cell, lived_cells, zoomed):
+        self.layout = layout
+        self.weeks_per_cell = weeks_per_cell
+        self.lived_cells = lived_cells
+        self.zoom_drawn = zoomed
+        # 重建时高亮框随 grid 标签一起删掉了，按新布局重新放上
+        self.highlight_item = None
+        if self.highlighted is not None:
+            self.highlight(self.highlighted)
+
+    def _rescale(self, layout):
+        # 行列数没变时只做一次缩放加一次平移，保留全部图元
+        old = self.layout
+        factor = layout.cell_size / old.cell_size
+        self.canvas.scale(self.tag, old.x0, old.y0, factor, factor)
+        self.canvas.move(self.tag, layout.x0 - old.x0, layout.y0 - old.y0)
+        self.layout = layout
+
+
+class WeekDetailsMixin:
+    """三个桌面入口共用的画布交互：悬停或点击显示某一周的详情，滚轮缩放，右键切换着色方式。
+
+    使用的类需要提供 canvas、week_grid、week_label、user_birth_date 和 week_detail_template()。
+    """
+
+    pinned_week = None
+    shown_week = None
+
+    def bind_week_events(self):
+        canvas = self.canvas
+        canvas.bind("<Motion>", self.on_canvas_motion)
+        canvas.bind("<Leave>", self.on_canvas_leave)
+        canvas.bind("<Button-1>", self.on_canvas_click)
+        canvas.bind("<MouseWheel>", self.on_canvas_wheel)
+        # X11 上滚轮是 4、5 号按钮
+        canvas.bind("<Button-4>", self.on_canvas_wheel)
+        canvas.bind("<Button-5>", self.on_canvas_wheel)
+        # 右键切换已度过的周的着色方式
+        canvas.bind("<Button-3>", self.on_canvas_right_click)
+
+    def on_canvas_motion(self, event):
+        if self.pinned_week is None:
+            self.show_week(self.week_grid.week_at(event.x, event.y))
+
+    def on_canvas_leave(self, event):
+        if self.pinned_week is None:
+            self.show_week(None)
+
+    def on_canvas_click(self, event):
+        # 点击固定显示这一周，再点同一周取消固定
+        week = self.week_grid.week_at(event.x, event.y)
+        self.pinned_week = None if week == self.pinned_week else week
+        self.show_week(week)
+
+    def on_canvas_wheel(self, event):
+        # 放大到逐周显示，只画可见部分；缩回原大小时恢复按月或按年的整体视图
+        steps = 1 if event.num == 4 or event.delta > 0 else -1
+        if self.week_grid.zoom_at(event.x, event.y, steps) is not None:
+            # 每格的周数可能变了，先按新的格子刷新日期范围
+            self.update_week_label()
+            self.on_canvas_motion(event)
+
+    def on_canvas_right_click(self, event):
+        self.week_grid.cycle_color_mode()
+
+    def show_week(self, week):
+        if week == self.shown_week:
+            return
+        self.shown_week = week
+        self.week_grid.highlight(week)
+        self.update_week_label()
+
+    def reset_week_details(self):
+        self.pinned_week = None
+        self.show_week(None)
+
+    def update_week_label(self):
+        week = self.shown_week
+        if week is None or self.user_birth_date is None:
+            self.week_label.config(text="")
+            return
+        # 按月或按年显示时，高亮的一格包含多周，日期范围覆盖整格
+        grid = self.week_grid
+        weeks = min(grid.weeks_per_cell, grid.total_weeks - week)
+        start, end = week_span(self.user_birth_date, week, weeks)
+        self.week_label.config(text=self.week_detail_template().format(
+            week=week + 1, start=f"{start:%Y-%m-%d}", end=f"{end:%Y-%m-%d}",
+            age=age_on(self.user_birth_date, start)))
+
+
+class AnimationManager:
+    """首页动画：一排格子逐个由白变绿，全部填满后从头再来。
+
+    格子的行列数由 cols、rows 决定；每次重新排好格子或重置颜色后调用 draw_banner，
+    默认什么也不画，子类可以在格子之外加上欢迎语等内容。
+    """
+
+    cols = 23
+    rows = 1
+    margin = 20
+
+    def __init__(self, canvas, frame_clock=None):
+        self.canvas = canvas
+        self.frame_clock = frame_clock or FrameClock(canvas)
+        self.animation_running = False
+        self.current_animation_id = None
+        self.current_step = 0
+        self.current_intensity = 0
+        self.cells = []
+        # 色表按参数缓存，各实例共用同一个元组
+        self.color_transition_steps = palette("#FFFFFF", "#008000", 10)
+
+    def start_animation(self):
+        if self.animation_running:
+            return
+        self.animation_running = True
+        self.current_step = 0
+        self.current_intensity = 0
+        self._animate_initial_canvas()
+        if self.current_animation_id is None:
+            self.current_animation_id = self.frame_clock.register(self._fill_cells)
+
+    def stop_animation(self):
+        self.animation_running = False
+        if self.current_animation_id is not None:
+            self.frame_clock.unregister(self.current_animation_id)
+            self.current_animation_id = None
+        self.canvas.delete("animation")
+        self.cells = []
+
+    def _animate_initial_canvas(self):
+        self.canvas.delete("animation")
+        self.cells = []
+        margin = self.margin
+        inner_width = self.canvas.winfo_width() - 2 * margin
+        inner_height = self.canvas.winfo_height() - 2 * margin
+
+        if inner_width <= 0 or inner_height <= 0:
+            return
+
+        cols, rows = self.cols, self.rows
+        cell_size = min(inner_width / cols, inner_height / rows)
+
+        new_margin_horizontal = (inner_width - (cols * cell_size)) / 2 + margin
+        new_margin_vertical = (inner_height - (rows * cell_size)) / 2 + margin
+
+        for row in range(rows):
+            for col in range(cols):
+                x1 = new_margin_horizontal + col * cell_size
+                y1 = new_margin_vertical + row * cell_size
+                self.cells.append(self.canvas.create_rectangle(x1, y1, x1 + cell_size, y1 + cell_size,
+                                                               fill=EMPTY_COLOR, outline=OUTLINE_COLOR,
+                                                               tags="animation"))
+
+        self.draw_banner()
+
+    def _fill_cells(self, frames=1):
+        if not self.animation_running:
+            return
+
+        # 画布尺寸还没确定时格子为空，等下一帧再创建
+        if not self.cells:
+            self._animate_initial_canvas()
+            return
+
+        # 每个格子只有一个图元；跳过的帧只推进状态，最后每个格子只改一次颜色
+        painted = {}
+        for _ in range(frames):
+            if self.current_step >= len(self.cells):
+                self.restart_animation()
+                return
+            if self.current_intensity < len(self.color_transition_steps):
+                painted[self.current_step] = self.color_transition_steps[self.current_intensity]
+                self.current_intensity += 1
+            else:
+                self.current_step += 1
+                self.current_intensity = 0
+
+        for index, color in painted.items():
+            self.canvas.itemconfig(self.cells[index], fill=color)
+
+    def restart_animation(self):
+        self.current_step = 0
+        self.current_intensity = 0
+        self.animation_running = True
+        if not self.cells:
+            self._animate_initial_canvas()
+            return
+        # 复用已有格子，只把颜色重置为白色
+        self.canvas.itemconfig("animation", fill=EMPTY_COLOR)
+        self.draw_banner()
+
+    def draw_banner(self):
+        pass
+
+
+class CanvasResizeMixin:
+    """三个桌面入口共用的画布缩放处理：画布第一次有实际尺寸时立即开始首页动画或画出格子，
+    之后的尺寸变化按上一次重绘耗时防抖。
+
+    使用的类需要提供 canvas、animation_manager、startup、user_birth_date、weeks_lived、total_weeks
+    和 update_canvas()。
+    """
+
+    canvas_sized = False
+    resize_in_progress = False
+    resize_delay = 100
+
+    def on_resize(self, event):
+        if not self.canvas_sized:
+            if event.width <= 1 or event.height <= 1:
+                return
+            # 画布第一次有了实际尺寸：立即开始首页动画，不用等固定的延迟和防抖
+            self.canvas_sized = True
+            if self.user_birth_date:
+                self.update_canvas(self.weeks_lived, self.total_weeks)
+            else:
+                self.animation_manager.start_animation()
+            self.startup.mark("animation")
+            return
+        if self.resize_in_progress:
+            return
+        self.resize_in_progress = True
+
+        self.canvas.after(self.resize_delay, self.complete_resize)
+
+    def complete_resize(self):
+        self.resize_in_progress = False
+        started = time.perf_counter()
+        if self.animation_manager.animation_running:
+            self.animation_manager.stop_animation()
+            self.animation_manager.start_animation()
+        elif self.user_birth_date:
+            self.update_canvas(self.weeks_lived, self.total_weeks)
+        # 防抖间隔跟随实际重绘耗时调整
+        self.resize_delay = resize_delay_for((time.perf_counter() - started) * 1000)